@@ -1,15 +1,42 @@
+import importlib
+
 # Import runtypes
 from runtypes.types.basic import Any, Union, Literal, Optional, Text, AnyStr, ByteString, Float, Integer, Boolean, List, Dict, Tuple
-from runtypes.types.advanced import Schema, Charset, Path, PathName, Email, Domain, Pattern, ID, Binary, Decimal, Hexadecimal
+from runtypes.types.advanced import Schema, Record, Charset, ByteCharset, Path, PathName, Email, Domain, Pattern, ID, Binary, Decimal, Hexadecimal, Base64Bytes, PrintableBytes, HexadecimalBytes
 
 # Import type hint utilities
 from runtypes.hints import cast_type_hints, check_type_hints, typecast, typecheck
 
+# Import JSON utilities
+from runtypes.json import cast_loads, check_loads
+
+# Import columnar utilities
+from runtypes.columnar import check_columns
+
+# Import iterative utilities
+from runtypes.iterative import check_iterative
+
 # Import tuple utilities
 from runtypes.tuples import TypedTuple, typedtuple
 
 # Import other utilities
-from runtypes.runtype import RunType, ArgumentError, typechecker
+from runtypes.runtype import RunType, CachedRunType, RegisteredRunType, Forward, CacheInfo, ArgumentError, typechecker
+from runtypes.adaptive import AdaptiveRunType
 
 # Add explicit exports
-__all__ = ["Any", "Union", "Literal", "Optional", "Text", "AnyStr", "ByteString", "Float", "Integer", "Boolean", "List", "Dict", "Tuple", "Schema", "Charset", "Path", "PathName", "Email", "Domain", "Pattern", "ID", "Binary", "Decimal", "Hexadecimal", "cast_type_hints", "check_type_hints", "typecast", "typecheck", "TypedTuple", "typedtuple", "RunType", "ArgumentError", "typechecker"]
\ No newline at end of file
+__all__ = [
+    "Any", "Union", "Literal", "Optional", "Text", "AnyStr", "ByteString", "Float", "Integer", "Boolean", "List", "Dict", "Tuple", "Schema", "Record", "Charset", "ByteCharset", "Path", "PathName", "Email", "Domain", "Pattern", "ID", "Binary", "Decimal", "Hexadecimal", "Base64Bytes", "PrintableBytes", "HexadecimalBytes", "cast_type_hints", "check_type_hints", "typecast", "typecheck", "cast_loads",
+    "check_loads", "acast", "acheck", "acast_iter", "acheck_iter", "check_columns", "check_iterative", "cast_many", "check_many", "TypedTuple", "typedtuple", "RunType", "CachedRunType", "RegisteredRunType", "Forward", "CacheInfo", "AdaptiveRunType", "ArgumentError", "typechecker"
+]
+
+# Utilities which depend on slow to import modules (asyncio, concurrent.futures), imported on first access
+_LAZY_IMPORTS = {"acast": "runtypes.asynchronous", "acheck": "runtypes.asynchronous", "acast_iter": "runtypes.asynchronous", "acheck_iter": "runtypes.asynchronous", "cast_many": "runtypes.parallel", "check_many": "runtypes.parallel"}
+
+
+def __getattr__(name):
+    # Make sure the attribute is a lazy import
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Import the utility from its module
+    return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
@@ -0,0 +1,129 @@
+import time
+import typing
+
+from runtypes.runtype import RunType, _assert, _assert_istype, _assert_isinstance
+from runtypes.types.basic import _union_check
+from runtypes.types.advanced import _schema_check
+
+# Only one in every few checks is timed, to keep the statistics lightweight
+_TIMING_INTERVAL = 8
+
+
+class AdaptiveRunType(RunType):
+
+    def __init__(self, runtype: RunType, interval: int = 1024) -> None:
+        # Make sure the runtype is a runtype
+        _assert_isinstance(runtype, RunType)
+
+        # Make sure the runtype is a subscripted schema or union
+        _assert(runtype._checker in (_schema_check, _union_check) and bool(runtype._arguments), "Runtype must be a subscripted Schema or Union")
+
+        # Make sure the interval is a positive int
+        _assert_istype(interval, int)
+        _assert(interval > 0, "Interval must be positive")
+
+        # Initialize the runtype with the original caster and checker
+        super(AdaptiveRunType, self).__init__(runtype._name, caster=runtype._caster, checker=runtype._checker, arguments=runtype._arguments)
+
+        # Create the list of checks, schema fields or union members, in declaration order
+        self._checks: typing.List[typing.Any] = list(runtype._arguments[0].items()) if runtype._checker is _schema_check else list(runtype._arguments)
+
+        # Set the reordering interval and the initial order
+        self._interval = interval
+        self._order = list(range(len(self._checks)))
+
+        # Initialize the statistics
+        self._calls = 0
+        self._attempts = [0] * len(self._checks)
+        self._failures = [0] * len(self._checks)
+        self._costs = [0] * len(self._checks)
+        self._timings = [0] * len(self._checks)
+
+    def _reorder(self) -> None:
+        # Schemas reject fastest when likely-to-fail and cheap fields run first
+        if self._checker is _schema_check:
+
+            def score(index: int) -> float:
+                # Fields that never failed run last
+                if not self._failures[index]:
+                    return 0.0
+
+                # Fields that were never timed are assumed to be cheap
+                cost = self._costs[index] / self._timings[index] if self._timings[index] else 1.0
+
+                # Failure probability per nanosecond of checking
+                return self._failures[index] / self._attempts[index] / max(cost, 1.0)
+        else:
+
+            def score(index: int) -> float:
+                # Unions accept fastest when frequently matching members run first
+                return float(self._attempts[index] - self._failures[index])
+
+        # Replace the order at once, ties keep the declaration order
+        self._order = sorted(range(len(self._checks)), key=lambda index: (-score(index), index))
+
+    def _check_schema(self, value: typing.Any, timed: bool) -> None:
+        # Make sure value is a dict
+        _assert_isinstance(value, dict)
+
+        # Loop over each key and value in the adaptive order
+        for index in self._order:
+            # Fetch the key, value type and value
+            _key, _value_type = self._checks[index]
+            _value = value.get(_key)
+
+            # Count the attempt and start timing
+            self._attempts[index] += 1
+            start = time.perf_counter_ns() if timed else 0
+
+            try:
+                # If the value type is a sub-schema
+                if isinstance(_value_type, dict):
+                    # Check value recursively
+                    _schema_check(_value, _value_type)
+                else:
+                    # Validate the value
+                    _assert_isinstance(_value, _value_type)
+            except TypeError:
+                # Count the failure
+                self._failures[index] += 1
+                raise
+            finally:
+                # Record the cost of the check
+                if timed:
+                    self._costs[index] += time.perf_counter_ns() - start
+                    self._timings[index] += 1
+
+    def _check_union(self, value: typing.Any) -> None:
+        # Loop over each member in the adaptive order
+        for index in self._order:
+            # Count the attempt
+            self._attempts[index] += 1
+
+            # Return on the first matching member
+            if isinstance(value, self._checks[index]):
+                return
+
+            # Count the failure
+            self._failures[index] += 1
+
+        # None of the members matched
+        raise TypeError(f"Value is not an instance of {tuple(self._checks)}")
+
+    def check(self, value: typing.Any) -> None:
+        # Count the call
+        self._calls += 1
+
+        # Periodically reorder the checks
+        if self._calls % self._interval == 0:
+            self._reorder()
+
+        # Check the value using the adaptive order
+        if self._checker is _schema_check:
+            self._check_schema(value, self._calls % _TIMING_INTERVAL == 0)
+        else:
+            self._check_union(value)
+
+    def __getitem__(self, argument: typing.Any) -> "RunType":
+        # Adaptive types are already complete
+        raise NotImplementedError(f"Cannot subscript an adaptive type {self!r}")
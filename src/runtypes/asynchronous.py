@@ -0,0 +1,94 @@
+import typing
+import asyncio
+import collections.abc
+import concurrent.futures
+
+from runtypes.runtype import RunType, _assert, _assert_istype, _assert_isinstance
+from runtypes.iterative import _check_iterative, check_iterative
+from runtypes.types.basic import _sequence_cast, _list_check, _dict_check
+
+# Number of steps or items processed between yields to the event loop
+_INTERVAL = 100
+
+
+def _exceeds_threshold(value: typing.Any, threshold: typing.Optional[int]) -> bool:
+    # Only sized values above the threshold are handed off to the executor
+    return threshold is not None and isinstance(value, collections.abc.Sized) and len(value) >= threshold
+
+
+async def acheck(value: typing.Any, value_type: typing.Any, max_depth: int = 1000, interval: int = _INTERVAL, executor: typing.Optional[concurrent.futures.Executor] = None, threshold: typing.Optional[int] = None) -> None:
+    # Make sure the interval is a positive int
+    _assert_istype(interval, int)
+    _assert(interval > 0, "Interval must be positive")
+
+    # Large values are checked in the executor, without blocking the event loop
+    if _exceeds_threshold(value, threshold):
+        return await asyncio.get_running_loop().run_in_executor(executor, check_iterative, value, value_type, max_depth)
+
+    # Check the value using the iterative engine, yielding to the event loop periodically
+    for _ in _check_iterative(value, value_type, max_depth, interval):
+        await asyncio.sleep(0)
+
+
+async def acast(value: typing.Any, value_type: typing.Any, interval: int = _INTERVAL, executor: typing.Optional[concurrent.futures.Executor] = None, threshold: typing.Optional[int] = None) -> typing.Any:
+    # Make sure the interval is a positive int
+    _assert_istype(interval, int)
+    _assert(interval > 0, "Interval must be positive")
+
+    # Large values are cast in the executor, without blocking the event loop
+    if _exceeds_threshold(value, threshold):
+        return await asyncio.get_running_loop().run_in_executor(executor, value_type, value)
+
+    # Only subscripted lists and dictionaries are cast in chunks
+    if not (type(value_type) is RunType and value_type._checker in (_list_check, _dict_check) and value_type._arguments):
+        return value_type(value)
+
+    # Lists are cast item by item
+    if value_type._checker is _list_check:
+        # Make sure value is a list
+        _assert_isinstance(value, collections.abc.Sequence)
+
+        # Create a list of casted items
+        items = []
+
+        # Cast the items, yielding to the event loop periodically
+        for index, item in enumerate(value, 1):
+            items.append(value_type._arguments[0](item))
+            if index % interval == 0:
+                await asyncio.sleep(0)
+
+        # Unchanged lists are returned as-is
+        return _sequence_cast(value, zip(value, items), list)
+
+    # Make sure value is a dictionary
+    _assert_isinstance(value, collections.abc.Mapping)
+
+    # Create a list of casted items
+    key_type, item_type = value_type._arguments
+    items = []
+
+    # Cast the keys and values, yielding to the event loop periodically
+    for index, (_key, _value) in enumerate(value.items(), 1):
+        items.append((key_type(_key), item_type(_value)))
+        if index % interval == 0:
+            await asyncio.sleep(0)
+
+    # Unchanged dictionaries are returned as-is
+    if type(value) is dict and all(casted_key is _key and casted_value is _value for (_key, _value), (casted_key, casted_value) in zip(value.items(), items)):
+        return value
+
+    # Create the casted dictionary
+    return dict(items)
+
+
+async def acast_iter(items: typing.AsyncIterable[typing.Any], value_type: typing.Any, interval: int = _INTERVAL) -> typing.AsyncIterator[typing.Any]:
+    # Cast each streamed item as it arrives
+    async for item in items:
+        yield await acast(item, value_type, interval=interval)
+
+
+async def acheck_iter(items: typing.AsyncIterable[typing.Any], value_type: typing.Any, max_depth: int = 1000, interval: int = _INTERVAL) -> typing.AsyncIterator[typing.Any]:
+    # Check each streamed item as it arrives
+    async for item in items:
+        await acheck(item, value_type, max_depth=max_depth, interval=interval)
+        yield item
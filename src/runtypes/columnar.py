@@ -0,0 +1,264 @@
+import re
+import typing
+import functools
+
+from runtypes.runtype import RunType, _assert
+from runtypes.types.basic import Any, Text, AnyStr, Float, Integer, Boolean, _optional_check, _literal_check, _list_check
+from runtypes.types.advanced import Schema, _schema_check, _charset_check, _pattern_check
+
+# Optional dependencies, imported on the first columnar validation since importing them is slow
+numpy: typing.Any = None
+pandas: typing.Any = None
+pyarrow: typing.Any = None
+
+# Column kinds accepted by the basic leaf types (bools are instances of int)
+_KINDS = {Integer: ("integer",), int: ("integer", "boolean"), Float: ("float",), float: ("float",), Boolean: ("boolean",), bool: ("boolean",), Text: ("string",), AnyStr: ("string",), str: ("string",)}
+
+
+@functools.lru_cache(maxsize=None)
+def _import_dependencies() -> None:
+    global numpy, pandas, pyarrow
+
+    # Columnar validation requires numpy, which both pandas and pyarrow depend on
+    try:
+        import numpy
+    except ImportError:
+        pass
+
+    # Pandas is optional
+    try:
+        import pandas
+    except ImportError:
+        pass
+
+    # Pyarrow is optional
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ImportError:
+        pyarrow = None
+
+
+def _inline_flags(flags: int) -> str:
+    # Convert the supported flags to inline flags, which both re and RE2 understand
+    inline_flags = "".join(flag for value, flag in ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s")) if flags & value)
+
+    # Return the inline flags group, if there are any
+    return f"(?{inline_flags})" if inline_flags else ""
+
+
+class _PandasColumns(object):
+
+    def __init__(self, frame: typing.Any) -> None:
+        # Set the frame and the number of rows
+        self._frame = frame
+        self.length = len(frame)
+
+    def column(self, key: str) -> typing.Any:
+        # Return the column, or None if it does not exist
+        return self._frame[key] if key in self._frame.columns else None
+
+    def kind(self, column: typing.Any) -> typing.Optional[str]:
+        # Booleans are checked before integers, since they are integers too
+        if pandas.api.types.is_bool_dtype(column.dtype):
+            return "boolean"
+
+        # Check numeric dtypes
+        if pandas.api.types.is_integer_dtype(column.dtype):
+            return "integer"
+        if pandas.api.types.is_float_dtype(column.dtype):
+            return "float"
+
+        # Infer the kind of object and string columns, skipping nulls
+        if pandas.api.types.infer_dtype(column, skipna=True) == "string":
+            return "string"
+
+        # The kind is unknown
+        return None
+
+    def present(self, column: typing.Any) -> typing.Any:
+        # NaN values of float columns are still floats
+        if pandas.api.types.is_float_dtype(column.dtype):
+            return numpy.ones(self.length, dtype=bool)
+
+        # Other values are present if they are not null
+        return column.notna().to_numpy(dtype=bool)
+
+    def match(self, column: typing.Any, pattern: str, flags: int) -> typing.Any:
+        # Match the beginning of the values using the vectorized string methods
+        return column.str.match(_inline_flags(flags) + pattern, na=False).to_numpy(dtype=bool)
+
+    def fullmatch(self, column: typing.Any, pattern: str) -> typing.Any:
+        # Match the entire values using the vectorized string methods
+        return column.str.fullmatch(pattern, na=False).to_numpy(dtype=bool)
+
+    def isin(self, column: typing.Any, values: typing.Sequence[typing.Any]) -> typing.Any:
+        # Check the values using the vectorized membership test
+        return column.isin(list(values)).to_numpy(dtype=bool)
+
+    def elementwise(self, column: typing.Any, function: typing.Callable[[typing.Any], bool]) -> typing.Any:
+        # Convert the values to python objects
+        values = column.astype(object)
+
+        # Nulls are converted to None, except for NaN values of float columns
+        if not pandas.api.types.is_float_dtype(column.dtype):
+            values = values.where(column.notna(), None)
+
+        # Check every value of the column, rows are never materialized
+        return numpy.fromiter((function(value) for value in values), dtype=bool, count=self.length)
+
+
+class _ArrowColumns(object):
+
+    def __init__(self, table: typing.Any) -> None:
+        # Set the table and the number of rows
+        self._table = table
+        self.length = table.num_rows
+
+    def column(self, key: str) -> typing.Any:
+        # Return the column, or None if it does not exist
+        return self._table.column(key) if key in self._table.column_names else None
+
+    def kind(self, column: typing.Any) -> typing.Optional[str]:
+        # Check the column type
+        if pyarrow.types.is_boolean(column.type):
+            return "boolean"
+        if pyarrow.types.is_integer(column.type):
+            return "integer"
+        if pyarrow.types.is_floating(column.type):
+            return "float"
+        if pyarrow.types.is_string(column.type) or pyarrow.types.is_large_string(column.type):
+            return "string"
+
+        # The kind is unknown
+        return None
+
+    def present(self, column: typing.Any) -> typing.Any:
+        # Values are present if they are not null
+        return self._to_numpy(pyarrow.compute.is_valid(column))
+
+    def match(self, column: typing.Any, pattern: str, flags: int) -> typing.Any:
+        try:
+            # Match the beginning of the values using the compute kernels
+            return self._to_numpy(pyarrow.compute.match_substring_regex(column, _inline_flags(flags) + f"^(?:{pattern})"))
+        except pyarrow.ArrowInvalid:
+            # Patterns that RE2 does not support (lookarounds, backreferences) are matched one by one
+            return self.elementwise(column, lambda value: value is not None and re.match(pattern, value, flags) is not None)
+
+    def fullmatch(self, column: typing.Any, pattern: str) -> typing.Any:
+        try:
+            # Match the entire values using the compute kernels
+            return self._to_numpy(pyarrow.compute.match_substring_regex(column, f"^(?:{pattern})$"))
+        except pyarrow.ArrowInvalid:
+            # Patterns that RE2 does not support are matched one by one
+            return self.elementwise(column, lambda value: value is not None and re.fullmatch(pattern, value) is not None)
+
+    def isin(self, column: typing.Any, values: typing.Sequence[typing.Any]) -> typing.Any:
+        try:
+            # Check the values using the membership kernel
+            return self._to_numpy(pyarrow.compute.is_in(column, value_set=pyarrow.array(list(values), type=column.type)))
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, pyarrow.ArrowNotImplementedError):
+            # Values that can't be converted to the column type are checked one by one
+            return self.elementwise(column, lambda value: value in values)
+
+    def elementwise(self, column: typing.Any, function: typing.Callable[[typing.Any], bool]) -> typing.Any:
+        # Check every value of the column, rows are never materialized
+        return numpy.fromiter((function(value) for value in column.to_pylist()), dtype=bool, count=self.length)
+
+    def _to_numpy(self, mask: typing.Any) -> typing.Any:
+        # Null results are failures
+        return mask.fill_null(False).to_numpy().astype(bool)
+
+
+def _column_mask(columns: typing.Any, column: typing.Any, value_type: typing.Any) -> typing.Any:
+    # Sub-schemas are checked like schemas
+    if isinstance(value_type, dict):
+        value_type = Schema[value_type]
+
+    # Missing columns are validated as None, like missing schema keys
+    if column is None:
+        return numpy.full(columns.length, isinstance(None, value_type), dtype=bool)
+
+    # Any accepts all values
+    if value_type is Any:
+        return numpy.ones(columns.length, dtype=bool)
+
+    # Basic leaf types are checked using the column type
+    kind = columns.kind(column)
+    if value_type in _KINDS and kind is not None:
+        return columns.present(column) if kind in _KINDS[value_type] else numpy.zeros(columns.length, dtype=bool)
+
+    # Subscripted types are checked using vectorized operations where possible
+    if isinstance(value_type, RunType) and value_type._arguments:
+        # Fetch the checker and arguments
+        checker, arguments = value_type._checker, value_type._arguments
+
+        # Optionals accept nulls and otherwise check the inner type
+        if checker is _optional_check:
+            return ~columns.present(column) | _column_mask(columns, column, arguments[0])
+
+        # Literals are checked using membership
+        if checker is _literal_check:
+            return columns.isin(column, arguments) | (~columns.present(column) if None in arguments else False)
+
+        # Charsets are checked using a full match of the character class
+        if checker is _charset_check and kind == "string":
+            return columns.present(column) & columns.fullmatch(column, f"[{re.escape(arguments[0])}]*")
+
+        # Patterns are checked using a match, like the pattern checker does
+        if checker is _pattern_check and kind == "string":
+            return columns.present(column) & columns.match(column, arguments[0], arguments[1] if len(arguments) > 1 else re.DOTALL)
+
+    # Other types are checked value by value
+    return columns.elementwise(column, lambda value: isinstance(value, value_type))
+
+
+def _resolve_columns(table: typing.Any) -> typing.Any:
+    # Pandas data frames
+    if pandas is not None and isinstance(table, pandas.DataFrame):
+        return _PandasColumns(table)
+
+    # Pyarrow tables
+    if pyarrow is not None and isinstance(table, pyarrow.Table):
+        return _ArrowColumns(table)
+
+    # Other tables are not supported
+    raise TypeError("Value is not a pandas DataFrame or a pyarrow Table")
+
+
+def check_columns(table: typing.Any, schema: typing.Any) -> typing.Tuple[typing.Any, typing.Dict[str, int]]:
+    # Import the optional dependencies
+    _import_dependencies()
+
+    # Make sure numpy is installed
+    _assert(numpy is not None, "Columnar validation requires pandas or pyarrow")
+
+    # Lists of schemas validate the same rows as schemas
+    if isinstance(schema, RunType) and schema._checker is _list_check and schema._arguments:
+        schema = schema._arguments[0]
+
+    # Unwrap subscripted schemas
+    if isinstance(schema, RunType) and schema._checker is _schema_check and schema._arguments:
+        schema = schema._arguments[0]
+
+    # Make sure the schema is a dict
+    _assert(isinstance(schema, dict), "Schema must be a subscripted Schema or a dict")
+
+    # Resolve the columns of the table
+    columns = _resolve_columns(table)
+
+    # Create the row mask and the failure counts
+    mask = numpy.ones(columns.length, dtype=bool)
+    failures = {}
+
+    # Loop over each key and value type
+    for _key, _value_type in schema.items():
+        # Check the whole column at once
+        column_mask = _column_mask(columns, columns.column(_key), _value_type)
+
+        # Count the failures and update the row mask
+        failures[_key] = int(columns.length - numpy.count_nonzero(column_mask))
+        mask &= column_mask
+
+    # Return the row mask and the failure counts
+    return mask, failures
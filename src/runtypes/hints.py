@@ -1,26 +1,137 @@
+import sys
+import types
 import typing
 import inspect
 import functools
+import dataclasses
 
-from runtypes.types.basic import Any
+from runtypes.types.basic import Any, Union, Literal, Optional, List, Dict, Tuple
 from runtypes.runtype import _resolve_function_arguments
 
+# PEP 604 unions (int | None) only exist in Python 3.10 and above
+_UNION_TYPES = tuple(union_type for union_type in (typing.Union, getattr(types, "UnionType", None)) if union_type is not None)
+
+# Cache of translated type hints, keyed by the original annotation, safe to share between threads since entries are only added using dict.setdefault
+_TRANSLATIONS: typing.Dict[typing.Any, typing.Any] = {}
+
+
+def _translate_union(arguments: typing.Tuple[typing.Any, ...]) -> typing.Any:
+    # Separate None from the rest of the union members
+    members = [_translate_type_hint(argument) for argument in arguments if argument is not type(None)]
+
+    # Create a union only if there are multiple members
+    union_type = members[0] if len(members) == 1 else Union[tuple(members)]
+
+    # If None was one of the members, the union is optional
+    if len(members) < len(arguments):
+        return Optional[union_type]
+
+    # Return the plain union
+    return union_type
+
+
+def _translate(annotation: typing.Any) -> typing.Any:
+    # Convert typing.Any to the Any runtype
+    if annotation is typing.Any:
+        return Any
+
+    # Convert None annotations to a literal
+    if annotation is None or annotation is type(None):
+        return Literal[None]
+
+    # Resolve the generic origin and arguments
+    origin = typing.get_origin(annotation)
+    arguments = typing.get_args(annotation)
+
+    # If this is not a generic, return the annotation as-is
+    if origin is None:
+        return annotation
+
+    # Translate unions and optionals
+    if origin in _UNION_TYPES:
+        return _translate_union(arguments)
+
+    # Translate literals
+    if origin is typing.Literal:
+        return Literal[arguments]
+
+    # Non-subscripted generics only check the origin type
+    if not arguments:
+        return origin
+
+    # Translate lists
+    if origin is list:
+        return List[_translate_type_hint(arguments[0])]
+
+    # Translate dictionaries
+    if origin is dict:
+        return Dict[_translate_type_hint(arguments[0]), _translate_type_hint(arguments[1])]
+
+    # Translate tuples, keeping the variadic ellipsis
+    if origin is tuple:
+        return Tuple[tuple(argument if argument is Ellipsis else _translate_type_hint(argument) for argument in arguments)]
+
+    # Unsupported generics only check the origin type
+    return origin
+
+
+def _translate_type_hint(annotation: typing.Any) -> typing.Any:
+    try:
+        # Fetch the translation from the cache
+        return _TRANSLATIONS[annotation]
+    except KeyError:
+        # Translate and store in the cache, concurrent translations all return the first stored value
+        return _TRANSLATIONS.setdefault(annotation, _translate(annotation))
+    except TypeError:
+        # Unhashable annotations can't be cached
+        return _translate(annotation)
+
 
 def _resolve_function_types(function: typing.Callable[..., typing.Any]) -> typing.Dict[str, type]:
+    # Get the function signature, which also works for partials and callable objects
+    signature = inspect.signature(function)
+
+    # Find the globals of the underlying function, partials and callable objects delegate to their function
+    target = inspect.unwrap(function)
+    target = target.func if isinstance(target, functools.partial) else target
+    namespace = getattr(target, "__globals__", None) or getattr(getattr(target, "__call__", None), "__globals__", {})
+
+    # Resolve string annotations and forward references of the raw annotations, without the defaults, since
+    # Python < 3.11 wraps the annotations of parameters which default to None with an implicit Optional
+    annotations = {name: parameter.annotation for name, parameter in signature.parameters.items() if parameter.annotation is not inspect.Parameter.empty}
+    hints = typing.get_type_hints(types.SimpleNamespace(__annotations__=annotations, __globals__=namespace))
+
     # Create a dictionary of types
     return {
-        # Any as default, annotation if defined
-        name: Any if parameter.annotation is inspect._empty else parameter.annotation
+        # Any as default, translated annotation if defined
+        name: _translate_type_hint(hints[name]) if name in hints else Any
         # For all signature parameters
-        for name, parameter in inspect.signature(function).parameters.items()
+        for name in signature.parameters
     }
 
 
-def cast_type_hints(function: typing.Callable[..., typing.Any], args: typing.Sequence[typing.Any], kwargs: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
-    # Resolve function types and arguments
-    types = _resolve_function_types(function)
-    arguments = _resolve_function_arguments(function, args, kwargs)
+def _resolve_fixed_types(function: typing.Callable[..., typing.Any], signature: inspect.Signature) -> typing.Dict[str, type]:
+    # Variadic parameters are passed as-is, only named parameters are casted
+    return {name: argument_type for name, argument_type in _resolve_function_types(function).items() if signature.parameters[name].kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)}
+
+
+def _bind_arguments(signature: inspect.Signature, args: typing.Sequence[typing.Any], kwargs: typing.Dict[str, typing.Any], arguments: typing.Dict[str, typing.Any]) -> typing.Tuple[typing.Sequence[typing.Any], typing.Dict[str, typing.Any]]:
+    # If all parameters can be passed by name, pass the casted arguments by name
+    if all(parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY) for parameter in signature.parameters.values()):
+        return (), arguments
+
+    # Bind the original arguments, so that variadic arguments keep their positions and names
+    bound = signature.bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+
+    # Replace the named arguments with the casted arguments
+    bound.arguments.update(arguments)
+
+    # Return the positional and keyword arguments
+    return bound.args, bound.kwargs
 
+
+def _cast_arguments(types: typing.Dict[str, type], arguments: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
     # Create an output dictionary
     output = {}
 
@@ -44,11 +155,7 @@ def cast_type_hints(function: typing.Callable[..., typing.Any], args: typing.Seq
     return output
 
 
-def check_type_hints(function: typing.Callable[..., typing.Any], args: typing.Sequence[typing.Any], kwargs: typing.Dict[str, typing.Any]) -> None:
-    # Resolve function types and arguments
-    types = _resolve_function_types(function)
-    arguments = _resolve_function_arguments(function, args, kwargs)
-
+def _check_arguments(types: typing.Dict[str, type], arguments: typing.Dict[str, typing.Any]) -> None:
     # Loop over the provided types and check them
     for argument_name, argument_type in types.items():
         # Check the argument type
@@ -56,29 +163,250 @@ def check_type_hints(function: typing.Callable[..., typing.Any], args: typing.Se
             raise TypeError(f"Argument {argument_name!r} is not an instance of {argument_type!r}")
 
 
-def typecast(function: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
+async def _acast_arguments(types: typing.Dict[str, type], arguments: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    # Import the asynchronous utilities lazily, since asyncio is slow to import
+    from runtypes.asynchronous import acast
+
+    # Create an output dictionary
+    output = {}
+
+    # Loop over all of the argument types
+    for argument_name, argument_type in types.items():
+        # Fetch the argument value
+        argument_value = arguments.get(argument_name)
+
+        # Is this argument type a type? If so, is the argument the same type?
+        if isinstance(argument_type, type) and isinstance(argument_value, argument_type):
+            # Set the argument
+            output[argument_name] = argument_value
+
+            # Continue!
+            continue
+
+        # Cast the argument without blocking the event loop
+        output[argument_name] = await acast(argument_value, argument_type)
+
+    # Create a casted dictionary with all items
+    return output
+
+
+async def _acheck_arguments(types: typing.Dict[str, type], arguments: typing.Dict[str, typing.Any]) -> None:
+    # Import the asynchronous utilities lazily, since asyncio is slow to import
+    from runtypes.asynchronous import acheck
+
+    # Loop over the provided types and check them
+    for argument_name, argument_type in types.items():
+        try:
+            # Check the argument type without blocking the event loop, without a depth limit like isinstance
+            await acheck(arguments.get(argument_name), argument_type, max_depth=sys.maxsize)
+        except TypeError:
+            raise TypeError(f"Argument {argument_name!r} is not an instance of {argument_type!r}")
+
+
+def cast_type_hints(function: typing.Callable[..., typing.Any], args: typing.Sequence[typing.Any], kwargs: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    # Resolve function types and arguments
+    types = _resolve_function_types(function)
+    arguments = _resolve_function_arguments(function, args, kwargs)
+
+    # Cast the arguments
+    return _cast_arguments(types, arguments)
+
+
+def check_type_hints(function: typing.Callable[..., typing.Any], args: typing.Sequence[typing.Any], kwargs: typing.Dict[str, typing.Any]) -> None:
+    # Resolve function types and arguments
+    types = _resolve_function_types(function)
+    arguments = _resolve_function_arguments(function, args, kwargs)
+
+    # Check the arguments
+    _check_arguments(types, arguments)
+
+
+def _resolve_dataclass_types(cls: type) -> typing.Dict[str, type]:
+    # Resolve string annotations and forward references using the class namespace
+    hints = typing.get_type_hints(cls)
+
+    # Create a dictionary of translated field types
+    return {field.name: _translate_type_hint(hints[field.name]) for field in dataclasses.fields(cls)}
+
+
+def _decorate_dataclass(cls: type, cast: bool, assignment: bool) -> None:
+    # Fetch the original initializer and attribute setter
+    initializer = cls.__init__
+    attribute_setter = cls.__setattr__
+
+    # Field types are resolved lazily, once, and shared by the initializer and the attribute setter
+    resolve_types = functools.lru_cache(maxsize=None)(lambda: _resolve_dataclass_types(cls))
+
+    # Whether field assignments are validated, which includes the assignments of the initializer
+    validates_assignment = assignment and not cls.__dataclass_params__.frozen
+
+    @functools.wraps(initializer)
+    def __init__(self: typing.Any, *args: typing.Any, **kwargs: typing.Any) -> None:
+        # Initialize the instance, so that defaults and factories are applied
+        initializer(self, *args, **kwargs)
+
+        # Fields were already validated when they were assigned
+        if validates_assignment:
+            return
+
+        # Fetch the field values
+        types = resolve_types()
+        fields = {name: getattr(self, name) for name in types}
+
+        # Check the field values
+        if not cast:
+            _check_arguments(types, fields)
+            return
+
+        # Replace the field values with the casted values, this works for frozen dataclasses too
+        for name, value in _cast_arguments(types, fields).items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self: typing.Any, name: str, value: typing.Any) -> None:
+        # Fetch the field types
+        types = resolve_types()
+
+        # Validate field assignments
+        if name in types:
+            # Cast or check the value
+            if cast:
+                value = _cast_arguments({name: types[name]}, {name: value})[name]
+            else:
+                _check_arguments({name: types[name]}, {name: value})
+
+        # Set the attribute
+        attribute_setter(self, name, value)
+
+    # Replace the initializer
+    cls.__init__ = __init__
+
+    # Replace the attribute setter, frozen dataclasses can't be assigned to anyway
+    if validates_assignment:
+        cls.__setattr__ = __setattr__
+
+
+def _decorate_class(cls: type, decorator: typing.Callable[[typing.Callable[..., typing.Any]], typing.Callable[..., typing.Any]], cast: bool, assignment: bool) -> type:
+    # Loop over all of the class members
+    for name, member in list(vars(cls).items()):
+        # Private members are not decorated, except for initializers, which dataclasses decorate separately
+        if name.startswith("_") and (name != "__init__" or dataclasses.is_dataclass(cls)):
+            continue
+
+        # Decorate static and class methods
+        if isinstance(member, (staticmethod, classmethod)):
+            setattr(cls, name, type(member)(decorator(member.__func__)))
+
+        # Decorate methods
+        elif inspect.isfunction(member):
+            setattr(cls, name, decorator(member))
+
+    # Dataclasses validate their fields when initialized
+    if dataclasses.is_dataclass(cls):
+        _decorate_dataclass(cls, cast, assignment)
+
+    # Return the decorated class
+    return cls
+
+
+def _typecast_function(function: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
+    # Types and signature are resolved lazily, on the first call, concurrent first calls resolve equal values so no lock is needed
+    types: typing.Optional[typing.Dict[str, type]] = None
+    signature: typing.Optional[inspect.Signature] = None
 
     @functools.wraps(function)
     def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
-        # Check the type hints
-        arguments = cast_type_hints(function, args, kwargs)
+        nonlocal types, signature
 
-        # Call the target function
-        return function(**arguments)
+        # Resolve and memoize the function types and signature
+        if types is None:
+            signature = inspect.signature(function)
+            types = _resolve_fixed_types(function, signature)
+
+        # Cast the arguments
+        arguments = _cast_arguments(types, _resolve_function_arguments(function, args, kwargs, signature=signature))
+
+        # Call the target function with the casted arguments in place of the original ones
+        args, kwargs = _bind_arguments(signature, args, kwargs, arguments)
+        return function(*args, **kwargs)
+
+    @functools.wraps(function)
+    async def coroutine_wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        nonlocal types, signature
+
+        # Resolve and memoize the function types and signature
+        if types is None:
+            signature = inspect.signature(function)
+            types = _resolve_fixed_types(function, signature)
+
+        # Cast the arguments without blocking the event loop
+        arguments = await _acast_arguments(types, _resolve_function_arguments(function, args, kwargs, signature=signature))
+
+        # Await the target coroutine with the casted arguments in place of the original ones
+        args, kwargs = _bind_arguments(signature, args, kwargs, arguments)
+        return await function(*args, **kwargs)
 
     # Return the decorator
-    return wrapper
+    return coroutine_wrapper if inspect.iscoroutinefunction(function) else wrapper
 
 
-def typecheck(function: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
+def _typecheck_function(function: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
+    # Types and signature are resolved lazily, on the first call, concurrent first calls resolve equal values so no lock is needed
+    types: typing.Optional[typing.Dict[str, type]] = None
+    signature: typing.Optional[inspect.Signature] = None
 
     @functools.wraps(function)
     def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
-        # Check the type hints
-        check_type_hints(function, args, kwargs)
+        nonlocal types, signature
+
+        # Resolve and memoize the function types and signature
+        if types is None:
+            types, signature = _resolve_function_types(function), inspect.signature(function)
+
+        # Check the arguments
+        _check_arguments(types, _resolve_function_arguments(function, args, kwargs, signature=signature))
 
         # Call the target function
         return function(*args, **kwargs)
 
+    @functools.wraps(function)
+    async def coroutine_wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        nonlocal types, signature
+
+        # Resolve and memoize the function types and signature
+        if types is None:
+            types, signature = _resolve_function_types(function), inspect.signature(function)
+
+        # Check the arguments without blocking the event loop
+        await _acheck_arguments(types, _resolve_function_arguments(function, args, kwargs, signature=signature))
+
+        # Await the target coroutine
+        return await function(*args, **kwargs)
+
     # Return the decorator
-    return wrapper
+    return coroutine_wrapper if inspect.iscoroutinefunction(function) else wrapper
+
+
+def typecast(function: typing.Any = None, assignment: bool = False) -> typing.Any:
+    # Allow passing options to the decorator
+    if function is None:
+        return functools.partial(typecast, assignment=assignment)
+
+    # Decorate classes and dataclasses
+    if isinstance(function, type):
+        return _decorate_class(function, _typecast_function, cast=True, assignment=assignment)
+
+    # Decorate the function
+    return _typecast_function(function)
+
+
+def typecheck(function: typing.Any = None, assignment: bool = False) -> typing.Any:
+    # Allow passing options to the decorator
+    if function is None:
+        return functools.partial(typecheck, assignment=assignment)
+
+    # Decorate classes and dataclasses
+    if isinstance(function, type):
+        return _decorate_class(function, _typecheck_function, cast=False, assignment=assignment)
+
+    # Decorate the function
+    return _typecheck_function(function)
@@ -0,0 +1,189 @@
+import typing
+
+from runtypes.runtype import RunType, Forward, _assert, _assert_istype, _assert_isinstance
+from runtypes.types.basic import _union_check, _optional_check, _list_check, _dict_check, _tuple_check
+from runtypes.types.advanced import _schema_check, _record_check
+
+# Stack items are values, value types and depths
+_Item = typing.Tuple[typing.Any, typing.Any, int]
+
+# Union choices are stack sizes, visited log sizes, values, members, member indexes and depths
+_Choice = typing.Tuple[int, int, typing.Any, typing.List[typing.Any], int, int]
+
+# Checkers of the subscripted runtypes which are expanded by the engine
+_EXPANDED = (_schema_check, _record_check, _list_check, _dict_check, _tuple_check, _optional_check, _union_check)
+
+# Marks the end of a union member on the stack, popped once the member fully matched
+_MATCHED = object()
+
+
+def _expand(value: typing.Any, value_type: typing.Any, depth: int) -> typing.List[_Item]:
+    # Sub-schemas are expanded like schemas
+    if isinstance(value_type, dict):
+        # Make sure value is a dict
+        _assert_isinstance(value, dict)
+
+        # Check each value against its value type
+        return [(value.get(_key), _value_type, depth + 1) for _key, _value_type in value_type.items()]
+
+    # Fetch the checker and arguments
+    checker, arguments = value_type._checker, value_type._arguments
+
+    # Schemas are expanded to their values
+    if checker is _schema_check:
+        return _expand(value, *arguments, depth)
+
+    # Records are expanded to their fields
+    if checker is _record_check:
+        # Make sure value is a record
+        _assert_isinstance(value, arguments[1])
+
+        # Check each field against its value type, sub-schemas are already sub-records
+        return [(_value, _value_type, depth + 1) for _value, _value_type in zip(value, arguments[0].values())]
+
+    # Lists are expanded to their items
+    if checker is _list_check:
+        # Make sure value is a list
+        _assert_isinstance(value, list)
+
+        # Check each item against the item type
+        return [(item, arguments[0], depth + 1) for item in value]
+
+    # Dictionaries are expanded to their keys and values
+    if checker is _dict_check:
+        # Make sure value is a dictionary
+        _assert_isinstance(value, dict)
+
+        # Check each key and value against their types
+        return [item for _key, _value in value.items() for item in ((_key, arguments[0], depth + 1), (_value, arguments[1], depth + 1))]
+
+    # Tuples are expanded to their items
+    if checker is _tuple_check:
+        # Make sure value is a tuple
+        _assert_isinstance(value, tuple)
+
+        # If the tuple is variadic, check all items against the same type
+        if len(arguments) == 2 and arguments[1] is Ellipsis:
+            return [(item, arguments[0], depth + 1) for item in value]
+
+        # Make sure value is of length
+        _assert(len(value) == len(arguments), "Value length does not match types")
+
+        # Check each item against its item type
+        return [(item, item_type, depth + 1) for item, item_type in zip(value, arguments)]
+
+    # Optionals are expanded to their value, if defined
+    if checker is _optional_check:
+        return [] if value is None else [(value, arguments[0], depth)]
+
+    # Other types are checked directly
+    _assert_isinstance(value, value_type)
+
+    # Nothing more to check
+    return []
+
+
+def _backtrack(stack: typing.List[_Item], visited: typing.Set[typing.Tuple[int, int]], log: typing.List[typing.Tuple[int, int]], choices: typing.List[_Choice], error: TypeError) -> None:
+    # Try the next member of the innermost union, until one is left to check
+    while choices:
+        # Fetch the innermost union
+        stack_size, log_size, value, members, index, depth = choices.pop()
+
+        # Drop the pending items of the failed member
+        del stack[stack_size:]
+
+        # Forget the containers visited by the failed member, their checks were not completed
+        while len(log) > log_size:
+            visited.discard(log.pop())
+
+        # If there are no more members, the union failed as a whole
+        if index + 1 == len(members):
+            error = TypeError(f"Value is not an instance of {tuple(members)}")
+            continue
+
+        # Check the value against the next member
+        choices.append((stack_size, log_size, value, members, index + 1, depth))
+        stack.extend(((None, _MATCHED, depth), (value, members[index + 1], depth)))
+        return
+
+    # None of the unions could recover from the error
+    raise error
+
+
+def _check_iterative(value: typing.Any, value_type: typing.Any, max_depth: int, interval: int) -> typing.Iterator[None]:
+    # Make sure the maximum depth and the interval are ints
+    _assert_istype(max_depth, int)
+    _assert_istype(interval, int)
+
+    # Containers that were already checked against a type, used to detect cycles, and the order they were visited in
+    visited: typing.Set[typing.Tuple[int, int]] = set()
+    log: typing.List[typing.Tuple[int, int]] = []
+
+    # Unions whose members are being checked, innermost last
+    choices: typing.List[_Choice] = []
+
+    # Create the stack with the root value
+    stack: typing.List[_Item] = [(value, value_type, 0)]
+
+    # Count the steps, to pause periodically
+    steps = 0
+
+    # Check values until the stack is empty
+    while stack:
+        # Pause every interval steps, if requested
+        steps += 1
+        if interval and steps % interval == 0:
+            yield
+
+        # Fetch the next value
+        value, value_type, depth = stack.pop()
+
+        # The innermost union member fully matched
+        if value_type is _MATCHED:
+            choices.pop()
+            continue
+
+        try:
+            # Make sure the depth is bounded
+            _assert(depth <= max_depth, f"Value is deeper than {max_depth!r} levels")
+
+            # Resolve forward references
+            while isinstance(value_type, Forward):
+                value_type = value_type._resolve()
+
+            # Only known subscripted runtypes and sub-schemas are expanded
+            if not isinstance(value_type, dict) and not (isinstance(value_type, RunType) and value_type._arguments and value_type._checker in _EXPANDED):
+                _assert_isinstance(value, value_type)
+                continue
+
+            # A container that is already being checked against the same type is a cycle, which is valid
+            if isinstance(value, (dict, list, tuple)):
+                # The value is alive during the whole check, so its identity is stable
+                key = (id(value), id(value_type))
+
+                # Skip visited containers
+                if key in visited:
+                    continue
+
+                # Mark the container as visited, logging it while a union member might still be backtracked
+                visited.add(key)
+                if choices:
+                    log.append(key)
+
+            # Unions are checked member by member, backtracking to the next member on failure
+            if not isinstance(value_type, dict) and value_type._checker is _union_check:
+                choices.append((len(stack), len(log), value, value_type._arguments, 0, depth))
+                stack.extend(((None, _MATCHED, depth), (value, value_type._arguments[0], depth)))
+                continue
+
+            # Push the children in reverse order, so they are checked in order
+            stack.extend(reversed(_expand(value, value_type, depth)))
+        except TypeError as error:
+            # Continue with the next member of the innermost union, if there is one
+            _backtrack(stack, visited, log, choices, error)
+
+
+def check_iterative(value: typing.Any, value_type: typing.Any, max_depth: int = 1000) -> None:
+    # Run the engine without pausing
+    for _ in _check_iterative(value, value_type, max_depth, 0):
+        pass
@@ -0,0 +1,212 @@
+import json
+import typing
+
+from json.decoder import WHITESPACE, scanstring
+
+from runtypes.runtype import RunType, Forward, _assert, _assert_isinstance
+from runtypes.types.basic import _optional_check, _list_check, _dict_check
+from runtypes.types.advanced import Schema, _schema_check
+
+# Decoder used to parse leaf values
+_DECODER = json.JSONDecoder()
+
+
+def _skip_whitespace(document: str, index: int) -> int:
+    # Return the index of the next non-whitespace character
+    return WHITESPACE.match(document, index).end()
+
+
+def _expect(document: str, index: int, character: str, message: str) -> int:
+    # Make sure the expected character is in place
+    if document[index:index + 1] != character:
+        raise json.JSONDecodeError(message, document, index)
+
+    # Return the index after the character
+    return index + 1
+
+
+def _parse_members(document: str, index: int, parse_member: typing.Callable[[str, int], int]) -> int:
+    # Skip the opening brace
+    index = _skip_whitespace(document, index + 1)
+
+    # Check whether the object is empty
+    if document[index:index + 1] == "}":
+        return index + 1
+
+    while True:
+        # Parse the member key
+        index = _expect(document, index, '"', "Expecting property name enclosed in double quotes")
+        key, index = scanstring(document, index)
+
+        # Skip the separator
+        index = _skip_whitespace(document, index)
+        index = _expect(document, index, ":", "Expecting ':' delimiter")
+
+        # Parse the member value
+        index = _skip_whitespace(document, parse_member(key, index))
+
+        # Check whether the object has ended
+        if document[index:index + 1] == "}":
+            return index + 1
+
+        # Skip the delimiter
+        index = _skip_whitespace(document, _expect(document, index, ",", "Expecting ',' delimiter"))
+
+
+def _parse_schema(document: str, index: int, schema: typing.Dict[str, typing.Any], cast: bool) -> typing.Tuple[typing.Dict[str, typing.Any], int]:
+    # Make sure the value is an object
+    _assert(document[index:index + 1] == "{", "Value is not an instance of dict")
+
+    # Create output dictionary
+    output = {}
+
+    def parse_member(key: str, index: int) -> int:
+        # Parse the value and validate it if it is part of the schema
+        output[key], index = _parse(document, index, schema.get(key), cast)
+
+        # Return the index after the value
+        return index
+
+    # Parse all of the members
+    index = _parse_members(document, index, parse_member)
+
+    # Validate keys that were not provided, like the schema does
+    missing = {_key: _validate(None, _value_type, cast) for _key, _value_type in schema.items() if _key not in output}
+
+    # If casting, only keep the schema keys
+    if cast:
+        output = {_key: output[_key] if _key in output else missing[_key] for _key in schema}
+
+    # Return the parsed object
+    return output, index
+
+
+def _parse_dict(document: str, index: int, key_type: type, value_type: type, cast: bool) -> typing.Tuple[typing.Dict[typing.Any, typing.Any], int]:
+    # Make sure the value is an object
+    _assert(document[index:index + 1] == "{", "Value is not an instance of dict")
+
+    # Create output dictionary
+    output = {}
+
+    def parse_member(key: str, index: int) -> int:
+        # Parse the value and validate both key and value
+        _value, index = _parse(document, index, value_type, cast)
+        output[_validate(key, key_type, cast)] = _value
+
+        # Return the index after the value
+        return index
+
+    # Parse all of the members
+    return output, _parse_members(document, index, parse_member)
+
+
+def _parse_list(document: str, index: int, item_type: type, cast: bool) -> typing.Tuple[typing.List[typing.Any], int]:
+    # Make sure the value is an array
+    _assert(document[index:index + 1] == "[", "Value is not an instance of list")
+
+    # Create output list
+    output = []
+
+    # Skip the opening bracket
+    index = _skip_whitespace(document, index + 1)
+
+    # Check whether the array is empty
+    if document[index:index + 1] == "]":
+        return output, index + 1
+
+    while True:
+        # Parse the next item
+        item, index = _parse(document, index, item_type, cast)
+        output.append(item)
+
+        # Check whether the array has ended
+        index = _skip_whitespace(document, index)
+        if document[index:index + 1] == "]":
+            return output, index + 1
+
+        # Skip the delimiter
+        index = _skip_whitespace(document, _expect(document, index, ",", "Expecting ',' delimiter"))
+
+
+def _validate(value: typing.Any, value_type: typing.Any, cast: bool) -> typing.Any:
+    # Sub-schemas are validated like schemas
+    if isinstance(value_type, dict):
+        value_type = Schema[value_type]
+
+    # Cast the value if needed
+    if cast:
+        return value_type(value)
+
+    # Validate the value
+    _assert_isinstance(value, value_type)
+
+    # Return the original value
+    return value
+
+
+def _parse(document: str, index: int, value_type: typing.Any, cast: bool) -> typing.Tuple[typing.Any, int]:
+    # Skip leading whitespace
+    index = _skip_whitespace(document, index)
+
+    # Resolve forward references
+    while isinstance(value_type, Forward):
+        value_type = value_type._resolve()
+
+    # Sub-schemas are parsed as objects
+    if isinstance(value_type, dict):
+        return _parse_schema(document, index, value_type, cast)
+
+    # Subscripted structural types are validated while parsing
+    if isinstance(value_type, RunType) and value_type._arguments:
+        # Schemas are parsed as objects
+        if value_type._checker is _schema_check:
+            return _parse_schema(document, index, *value_type._arguments, cast)
+
+        # Lists are parsed as arrays
+        if value_type._checker is _list_check:
+            return _parse_list(document, index, *value_type._arguments, cast)
+
+        # Dictionaries are parsed as objects
+        if value_type._checker is _dict_check:
+            return _parse_dict(document, index, *value_type._arguments, cast)
+
+        # Optionals are parsed as their inner type unless null
+        if value_type._checker is _optional_check and not document.startswith("null", index):
+            return _parse(document, index, *value_type._arguments, cast)
+
+    # Parse the leaf value using the decoder
+    value, index = _DECODER.raw_decode(document, index)
+
+    # Values without a type are not validated
+    if value_type is None:
+        return value, index
+
+    # Validate the leaf value
+    return _validate(value, value_type, cast), index
+
+
+def _loads(document: typing.Union[str, bytes, bytearray], value_type: typing.Any, cast: bool) -> typing.Any:
+    # Decode binary documents like the json module does
+    if isinstance(document, (bytes, bytearray)):
+        document = document.decode(json.detect_encoding(document), "surrogatepass")
+
+    # Parse the document while validating
+    value, index = _parse(document, 0, value_type, cast)
+
+    # Make sure there is no extra data
+    index = _skip_whitespace(document, index)
+    if index != len(document):
+        raise json.JSONDecodeError("Extra data", document, index)
+
+    # Return the parsed value
+    return value
+
+
+def cast_loads(document: typing.Union[str, bytes, bytearray], value_type: typing.Any) -> typing.Any:
+    # Parse the document while casting
+    return _loads(document, value_type, cast=True)
+
+
+def check_loads(document: typing.Union[str, bytes, bytearray], value_type: typing.Any) -> typing.Any:
+    # Parse the document while checking
+    return _loads(document, value_type, cast=False)
@@ -0,0 +1,74 @@
+import os
+import typing
+import threading
+import collections.abc
+import concurrent.futures
+
+from runtypes.runtype import _assert, _assert_istype
+
+
+def _resolve_chunks(values: typing.Sequence[typing.Any], threads: typing.Optional[int]) -> typing.Tuple[int, typing.List[typing.Tuple[int, typing.Sequence[typing.Any]]]]:
+    # Use the same default as the thread pool executor
+    if threads is None:
+        threads = min(32, (os.cpu_count() or 1) + 4)
+
+    # Make sure the number of threads is a positive int
+    _assert_istype(threads, int)
+    _assert(threads > 0, "Threads must be positive")
+
+    # Split the values into a few chunks per thread, to balance uneven costs
+    chunk_size = max(1, -(-len(values) // (threads * 4)))
+
+    # Create the list of chunks with their offsets
+    return threads, [(offset, values[offset:offset + chunk_size]) for offset in range(0, len(values), chunk_size)]
+
+
+def cast_many(values: typing.Iterable[typing.Any], value_type: typing.Any, threads: typing.Optional[int] = None) -> typing.List[typing.Any]:
+    # Make sure the values are a sequence
+    values = values if isinstance(values, collections.abc.Sequence) else list(values)
+
+    # Split the values into chunks
+    threads, chunks = _resolve_chunks(values, threads)
+
+    def cast_chunk(chunk: typing.Tuple[int, typing.Sequence[typing.Any]]) -> typing.List[typing.Any]:
+        # Cast all of the values in the chunk
+        return [value_type(value) for value in chunk[1]]
+
+    # Cast the chunks using the thread pool
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        return [value for chunk in executor.map(cast_chunk, chunks) for value in chunk]
+
+
+def check_many(values: typing.Iterable[typing.Any], value_type: typing.Any, threads: typing.Optional[int] = None) -> None:
+    # Make sure the values are a sequence
+    values = values if isinstance(values, collections.abc.Sequence) else list(values)
+
+    # Split the values into chunks
+    threads, chunks = _resolve_chunks(values, threads)
+
+    # The lowest failing index, chunks stop once they pass it
+    lowest = len(values)
+    lock = threading.Lock()
+
+    def check_chunk(chunk: typing.Tuple[int, typing.Sequence[typing.Any]]) -> None:
+        nonlocal lowest
+
+        # Loop over the values in the chunk
+        for index, value in enumerate(chunk[1], chunk[0]):
+            # Stop if a lower index already failed
+            if index > lowest:
+                return
+
+            # Check the value type
+            if not isinstance(value, value_type):
+                with lock:
+                    lowest = min(lowest, index)
+                return
+
+    # Check the chunks using the thread pool
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        for future in [executor.submit(check_chunk, chunk) for chunk in chunks]:
+            future.result()
+
+    # Raise the failure with the lowest index, regardless of which chunk finished first
+    _assert(lowest == len(values), f"Value at index {lowest!r} is not an instance of {value_type!r}")
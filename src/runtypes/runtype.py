@@ -1,5 +1,24 @@
+import sys
 import typing
 import inspect
+import threading
+import contextvars
+import collections
+
+# Statistics of cached runtypes
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+# Whether casts should rebuild containers instead of returning unchanged ones as-is
+_COPY = contextvars.ContextVar("_COPY", default=False)
+
+# Scalar types whose equal instances always share results
+_SCALAR_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+# Whether a forward reference cast is in progress, only the outermost cast reports values which are too deep
+_FORWARD_CAST = contextvars.ContextVar("_FORWARD_CAST", default=False)
+
+# Types whose instances can't change after being validated
+_IMMUTABLE_TYPES = _SCALAR_TYPES + (range, type(Ellipsis))
 
 
 def _assert(_condition: bool, _error: str) -> None:
@@ -22,9 +41,32 @@ class ArgumentError(KeyError):
     pass
 
 
-def _resolve_function_arguments(function: typing.Callable[..., typing.Any], args: typing.Sequence[typing.Any], kwargs: typing.Dict[str, typing.Any], strict: bool = False) -> typing.Dict[str, typing.Any]:
-    # Get the function signature
-    signature = inspect.signature(function)
+def _is_immutable(value: typing.Any) -> bool:
+    # Create the stack with the root value
+    stack = [value]
+
+    # Check values until the stack is empty
+    while stack:
+        # Fetch the next value
+        value = stack.pop()
+
+        # Tuples (including typed tuples) and frozensets are immutable if their items are
+        if isinstance(value, (tuple, frozenset)):
+            stack.extend(value)
+            continue
+
+        # Other values must be of an immutable type
+        if type(value) not in _IMMUTABLE_TYPES:
+            return False
+
+    # All values are immutable
+    return True
+
+
+def _resolve_function_arguments(function: typing.Callable[..., typing.Any], args: typing.Sequence[typing.Any], kwargs: typing.Dict[str, typing.Any], strict: bool = False, signature: typing.Optional[inspect.Signature] = None) -> typing.Dict[str, typing.Any]:
+    # Get the function signature, unless it was memoized by the caller
+    if signature is None:
+        signature = inspect.signature(function)
 
     # Create a dictionary for arguments
     arguments = {}
@@ -87,19 +129,27 @@ class RunType(object):
         self._checker = checker
         self._arguments = arguments
 
-    def cast(self, value: typing.Any) -> typing.Any:
+    def cast(self, value: typing.Any, copy: bool = False) -> typing.Any:
+        # If requested, rebuild all containers while casting, leaf values are not copied
+        if copy:
+            token = _COPY.set(True)
+            try:
+                return self.cast(value)
+            finally:
+                _COPY.reset(token)
+
         # If the type caster is defined, execute it
         if self._caster:
             # Make sure all caster arguments have been resolved
             _resolve_function_arguments(self._caster, [value] + self._arguments, {}, strict=True)
 
-            # Use the caster to cast the value
-            return self._caster(value, *self._arguments)
-
-        # Fallback - check using type checker, then return value
-        self.check(value)
+            # Use the caster to cast the value, unchanged containers are returned as-is
+            value = self._caster(value, *self._arguments)
+        else:
+            # Fallback - check using type checker
+            self.check(value)
 
-        # Return original value
+        # Return the value
         return value
 
     def check(self, value: typing.Any) -> None:
@@ -160,6 +210,192 @@ class RunType(object):
         # Return the generated representation
         return representation
 
+    def cached(self, maxsize: int = 1024) -> "CachedRunType":
+        # Create a cached version of this type
+        return CachedRunType(self, maxsize)
+
+    def registered(self, maxsize: int = 1024) -> "RegisteredRunType":
+        # Create a version of this type which remembers validated objects
+        return RegisteredRunType(self, maxsize)
+
+
+class CachedRunType(RunType):
+
+    def __init__(self, runtype: RunType, maxsize: int = 1024) -> None:
+        # Make sure the runtype is a runtype
+        _assert_isinstance(runtype, RunType)
+
+        # Make sure the maximum size is a positive int
+        _assert_istype(maxsize, int)
+        _assert(maxsize > 0, "Maximum size must be positive")
+
+        # Initialize the runtype with the original caster and checker
+        super(CachedRunType, self).__init__(runtype._name, caster=runtype._caster, checker=runtype._checker, arguments=runtype._arguments)
+
+        # Set the original runtype and the maximum size
+        self._runtype = runtype
+        self._maxsize = maxsize
+
+        # Results are kept in least-recently-used order, guarded by a lock so that cached runtypes can be shared between threads
+        self._results: typing.OrderedDict[typing.Any, typing.Optional[typing.Tuple[type, typing.Tuple[typing.Any, ...]]]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        # Initialize the statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def check(self, value: typing.Any) -> None:
+        # Only scalars are cached, equal containers may hold items of different types ((1,), (True,))
+        if type(value) not in _SCALAR_TYPES:
+            return self._runtype.check(value)
+
+        # Equal values of different types (1, 1.0, True) must not share results
+        key = (type(value), value)
+
+        try:
+            # Look up the result of a previous check
+            with self._lock:
+                result = self._results[key]
+                self._results.move_to_end(key)
+                self._hits += 1
+        except KeyError:
+            # Check the value and store the result
+            result = self._check(key, value)
+
+        # Raise the cached failure if there was one
+        if result is not None:
+            error_type, error_arguments = result
+            raise error_type(*error_arguments)
+
+    def _check(self, key: typing.Tuple[type, typing.Any], value: typing.Any) -> typing.Optional[typing.Tuple[type, typing.Tuple[typing.Any, ...]]]:
+        try:
+            # Check the value using the original runtype
+            self._runtype.check(value)
+
+            # Type-checking passed
+            result = None
+        except ArgumentError:
+            # Re-raise without caching
+            raise
+        except Exception as error:
+            # Type-checking failed, store the error
+            result = (type(error), error.args)
+
+        with self._lock:
+            # Store the result
+            self._misses += 1
+            self._results[key] = result
+
+            # Evict the least recently used results
+            while len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+                self._evictions += 1
+
+        # Return the result
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        # Return the cache statistics
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._results))
+
+    def cache_clear(self) -> None:
+        # Clear the results and the statistics
+        with self._lock:
+            self._results.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __getitem__(self, argument: typing.Any) -> "RunType":
+        # Cached types are already complete
+        raise NotImplementedError(f"Cannot subscript a cached type {self!r}")
+
+
+class RegisteredRunType(CachedRunType):
+
+    def check(self, value: typing.Any) -> None:
+        # Objects are registered by identity, the registry keeps them alive so identities are never reused
+        key = id(value)
+
+        # Look up the object in the registry
+        with self._lock:
+            if key in self._results and self._results[key] is value:
+                self._results.move_to_end(key)
+                self._hits += 1
+                return
+
+            # Count the miss, whether or not the object can be registered
+            self._misses += 1
+
+        # Check the value using the original runtype
+        self._runtype.check(value)
+
+        # Only immutable objects can be registered, mutable objects might change after validation
+        if not _is_immutable(value):
+            return
+
+        with self._lock:
+            # Register the validated object
+            self._results[key] = value
+
+            # Evict the least recently used objects
+            while len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+                self._evictions += 1
+
+
+class Forward(RunType):
+
+    def __init__(self, name: str) -> None:
+        # Initialize the runtype with delegating caster and checker
+        super(Forward, self).__init__(name, caster=self._cast_target, checker=self._check_target)
+
+        # The target is defined later, allowing recursive types
+        self._target: typing.Any = None
+
+    def define(self, target: typing.Any) -> "Forward":
+        # Make sure the forward reference was not defined already
+        _assert(self._target is None, f"Forward reference {self._name!r} is already defined")
+
+        # Set the target
+        self._target = target
+
+        # Return self for chaining
+        return self
+
+    def _resolve(self) -> typing.Any:
+        # Make sure the forward reference was defined
+        if self._target is None:
+            raise ArgumentError(f"Forward reference {self._name!r} is not defined")
+
+        # Return the target
+        return self._target
+
+    def _cast_target(self, value: typing.Any) -> typing.Any:
+        # Nested casts are guarded by the outermost cast
+        if _FORWARD_CAST.get():
+            return self._resolve()(value)
+
+        # Cast using the target, recursive casts are bounded by the recursion limit
+        token = _FORWARD_CAST.set(True)
+        try:
+            return self._resolve()(value)
+        except RecursionError:
+            raise TypeError(f"Value is too deep to cast to {self!r}") from None
+        finally:
+            _FORWARD_CAST.reset(token)
+
+    def _check_target(self, value: typing.Any) -> None:
+        # Import the iterative engine lazily, since it depends on the basic types
+        from runtypes.iterative import check_iterative
+
+        # Check using the target without recursion, so deep and cyclic values are checked like check_iterative does
+        check_iterative(value, self._resolve(), max_depth=sys.maxsize)
+
+    def __getitem__(self, argument: typing.Any) -> "RunType":
+        # Forward references are subscripted in their definition
+        raise NotImplementedError(f"Cannot subscript a forward reference {self!r}")
+
 
 # Decorator for easy typechecker creating
 def typechecker(function: typing.Callable[..., typing.Any]) -> RunType:
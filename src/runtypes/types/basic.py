@@ -1,7 +1,8 @@
 import typing
+import itertools
 import collections.abc
 
-from runtypes.runtype import RunType, _assert, _assert_istype, _assert_isinstance
+from runtypes.runtype import RunType, _COPY, _assert, _assert_istype, _assert_isinstance
 
 # Any is the most basic type and is used by other types, hence defined here
 Any = RunType("Any", lambda value: value)
@@ -72,14 +73,59 @@ def _string_check(value: typing.Any) -> None:
     _assert_istype(value, str)
 
 
-def _bytestring_cast(value: typing.Any) -> bytes:
-    # Cast to bytes
-    return bytes(value)
+def _buffer_size(value: typing.Any) -> int:
+    # Create a memoryview, which does not copy the buffer
+    with memoryview(value) as view:
+        return view.nbytes
 
 
-def _bytestring_check(value: typing.Any) -> None:
-    # Make sure the value is an instance of bytes
-    _assert_isinstance(value, (bytes, bytearray))
+def _bytestring_cast(value: typing.Any, max_length: typing.Optional[int] = None) -> typing.Any:
+    try:
+        # Make sure the value is a buffer
+        memoryview(value).release()
+    except TypeError:
+        # Cast to bytes
+        value = bytes(value)
+
+    # Make sure the buffer is valid
+    _bytestring_check(value, max_length)
+
+    # Buffers are returned as-is, without copying
+    return value
+
+
+def _bytestring_check(value: typing.Any, max_length: typing.Optional[int] = None) -> None:
+    try:
+        # Make sure the value supports the buffer protocol
+        size = _buffer_size(value)
+    except TypeError:
+        raise TypeError("Value does not support the buffer protocol")
+
+    # Make sure the buffer is not too long
+    if max_length is not None:
+        _assert(size <= max_length, f"Value is longer than {max_length!r} bytes")
+
+
+def _sequence_cast(value: typing.Any, items: typing.Iterable[typing.Tuple[typing.Any, typing.Any]], container: type) -> typing.Any:
+    # The output is only created once an item changes, unless copying was requested
+    output = [] if _COPY.get() else None
+
+    # Loop over original and casted items
+    for index, (item, casted_item) in enumerate(items):
+        # Copy the unchanged prefix once the first item changes
+        if output is None and casted_item is not item:
+            output = list(itertools.islice(value, index))
+
+        # Append the item once copying has started
+        if output is not None:
+            output.append(casted_item)
+
+    # If nothing changed, return the original value
+    if output is None:
+        return value if type(value) is container else container(value)
+
+    # Create the container from the output
+    return output if container is list else container(output)
 
 
 def _list_cast(value: typing.Any, item_type: type) -> typing.List[typing.Any]:
@@ -87,7 +133,7 @@ def _list_cast(value: typing.Any, item_type: type) -> typing.List[typing.Any]:
     _assert_isinstance(value, collections.abc.Sequence)
 
     # Loop over value and cast items
-    return [item_type(item) for item in value]
+    return _sequence_cast(value, ((item, item_type(item)) for item in value), list)
 
 
 def _list_check(value: typing.Any, item_type: type) -> None:
@@ -103,8 +149,28 @@ def _dict_cast(value: typing.Any, key_type: type, value_type: type) -> typing.Di
     # Make sure value is a dictionary
     _assert_isinstance(value, collections.abc.Mapping)
 
+    # The output is only created once an item changes, unless copying was requested
+    output = {} if _COPY.get() else None
+
     # Loop over value and cast items
-    return {key_type(_key): value_type(_value) for _key, _value in value.items()}
+    for index, (_key, _value) in enumerate(value.items()):
+        # Cast the key and the value
+        casted_key, casted_value = key_type(_key), value_type(_value)
+
+        # Copy the unchanged prefix once the first item changes
+        if output is None and (casted_key is not _key or casted_value is not _value):
+            output = dict(itertools.islice(value.items(), index))
+
+        # Set the item once copying has started
+        if output is not None:
+            output[casted_key] = casted_value
+
+    # If nothing changed, return the original value
+    if output is None:
+        return value if type(value) is dict else dict(value)
+
+    # Return the copied dictionary
+    return output
 
 
 def _dict_check(value: typing.Any, key_type: type, value_type: type) -> None:
@@ -126,11 +192,15 @@ def _tuple_cast(value: typing.Any, *item_types: type) -> typing.Tuple[typing.Any
     if not item_types:
         return tuple(value)
 
+    # If the tuple is variadic, cast all items to the same type
+    if len(item_types) == 2 and item_types[1] is Ellipsis:
+        return _sequence_cast(value, ((item, item_types[0](item)) for item in value), tuple)
+
     # Make sure value is of length
     _assert(len(value) == len(item_types), "Value length does not match types")
 
     # Check all item types
-    return tuple(item_type(item) for item, item_type in zip(value, item_types))
+    return _sequence_cast(value, ((item, item_type(item)) for item, item_type in zip(value, item_types)), tuple)
 
 
 def _tuple_check(value: typing.Any, *item_types: type) -> None:
@@ -141,6 +211,14 @@ def _tuple_check(value: typing.Any, *item_types: type) -> None:
     if not item_types:
         return
 
+    # If the tuple is variadic, check all items against the same type
+    if len(item_types) == 2 and item_types[1] is Ellipsis:
+        for item in value:
+            _assert_isinstance(item, item_types[0])
+
+        # Nothing more to do
+        return
+
     # Make sure value is of length
     _assert(len(value) == len(item_types), "Value length does not match types")
 
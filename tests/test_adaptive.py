@@ -0,0 +1,48 @@
+import pytest
+
+from runtypes import *
+
+
+def test_adaptive_schema():
+    schema = AdaptiveRunType(Schema[{"email": Email, "kind": Literal["a", "b"], "sub": {"value": Integer}}], interval=16)
+
+    # Make the literal field fail most of the time
+    for index in range(64):
+        assert not isinstance({"email": "user@example.com", "kind": "c", "sub": {"value": 1}}, schema)
+
+    # The failing field now runs first
+    assert schema._checks[schema._order[0]][0] == "kind"
+
+    # Acceptance is never affected by the order
+    assert isinstance({"email": "user@example.com", "kind": "a", "sub": {"value": 1}}, schema)
+    assert not isinstance({"email": "user", "kind": "a", "sub": {"value": 1}}, schema)
+    assert not isinstance({"email": "user@example.com", "kind": "a", "sub": {"value": "1"}}, schema)
+    assert not isinstance(None, schema)
+    assert schema({"email": "user@example.com", "kind": "b", "sub": {"value": "1"}}) == {"email": "user@example.com", "kind": "b", "sub": {"value": 1}}
+
+
+def test_adaptive_union():
+    union = AdaptiveRunType(Union[Text, Integer, Float], interval=8)
+
+    # Make the last member match most of the time
+    for index in range(16):
+        assert isinstance(1.0, union)
+
+    # The matching member is now tried first
+    assert union._order == [2, 0, 1]
+
+    # Acceptance is never affected by the order
+    assert isinstance("Hello", union)
+    assert isinstance(1, union)
+    assert not isinstance(None, union)
+
+
+def test_adaptive_errors():
+    with pytest.raises(TypeError):
+        AdaptiveRunType(Integer)
+
+    with pytest.raises(TypeError):
+        AdaptiveRunType(Schema)
+
+    with pytest.raises(NotImplementedError):
+        AdaptiveRunType(Union[Text, Integer])[Float]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import sys
+import pytest
+
+from runtypes import *
+
+
+def test_string_annotations():
+
+    @typecheck
+    def my_function(a: int, b: Text, c=None):
+        return (a, b, c)
+
+    assert my_function(1, "2") == (1, "2", None)
+
+    with pytest.raises(TypeError):
+        my_function("1", "2")
+
+
+def test_string_annotations_cast():
+
+    @typecast
+    def my_function(a: int, b: Optional[Boolean]):
+        return (a, b)
+
+    assert my_function("1", 1) == (1, True)
+
+
+def test_forward_references():
+
+    @typecheck
+    def my_function(a: MyClass):
+        return a
+
+    x = MyClass()
+
+    assert my_function(x) is x
+
+    with pytest.raises(TypeError):
+        my_function(1)
+
+
+def test_lazy_resolution():
+
+    @typecheck
+    def my_function(a: UndefinedClass):
+        return a
+
+    # Resolution only fails when the function is called
+    with pytest.raises(NameError):
+        my_function(1)
+
+
+class MyClass:
+    pass
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="PEP 585 and PEP 604 annotations require Python 3.10")
+def test_builtin_generic_annotations():
+
+    @typecheck
+    def my_function(a: list[int], b: dict[str, int], c: int | None = None):
+        return (a, b, c)
+
+    assert my_function([1], {"a": 1}) == ([1], {"a": 1}, None)
+
+    with pytest.raises(TypeError):
+        my_function(["1"], {"a": 1})
+
+    with pytest.raises(TypeError):
+        my_function([1], {"a": "1"})
+
+    with pytest.raises(TypeError):
+        my_function([1], {"a": 1}, "c")
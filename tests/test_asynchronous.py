@@ -0,0 +1,132 @@
+import pytest
+import asyncio
+import concurrent.futures
+
+from runtypes import *
+
+
+def test_acheck():
+    schema = List[Schema[{"id": Integer, "tags": List[Text]}]]
+    values = [{"id": index, "tags": ["a"]} for index in range(100)]
+
+    asyncio.run(acheck(values, schema, interval=10))
+
+    with pytest.raises(TypeError):
+        asyncio.run(acheck(values + [{"id": "1", "tags": []}], schema, interval=10))
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        asyncio.run(acheck(values, schema, executor=executor, threshold=10))
+
+        with pytest.raises(TypeError):
+            asyncio.run(acheck(values + [None], schema, executor=executor, threshold=10))
+
+
+def test_acheck_yields():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        await acheck(list(range(1000)), List[Integer], interval=10)
+        task.cancel()
+
+    asyncio.run(main())
+
+    # The event loop ran other tasks while checking
+    assert len(ticks) > 10
+
+
+def test_acast():
+    items = [1, 2, 3]
+    assert asyncio.run(acast(items, List[Integer], interval=2)) is items
+    assert asyncio.run(acast(["1", 2, "3"], List[Integer], interval=2)) == [1, 2, 3]
+    assert asyncio.run(acast({"a": "1"}, Dict[Text, Integer], interval=2)) == {"a": 1}
+    assert asyncio.run(acast("1", Integer)) == 1
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        assert asyncio.run(acast(["1", 2], List[Integer], executor=executor, threshold=1)) == [1, 2]
+
+
+def test_iterators():
+
+    async def stream():
+        for value in ["1", 2, "3"]:
+            yield value
+
+    async def cast_all():
+        return [value async for value in acast_iter(stream(), Integer)]
+
+    async def check_all():
+        return [value async for value in acheck_iter(stream(), Integer)]
+
+    assert asyncio.run(cast_all()) == [1, 2, 3]
+
+    with pytest.raises(TypeError):
+        asyncio.run(check_all())
+
+
+def test_coroutine_hints():
+
+    @typecheck
+    async def my_function(a: List[Integer], b: Text = "b"):
+        return (a, b)
+
+    @typecast
+    async def my_cast_function(a: List[Integer], b: Optional[Integer] = None):
+        return (a, b)
+
+    assert asyncio.run(my_function([1, 2])) == ([1, 2], "b")
+    assert asyncio.run(my_cast_function(["1"], "2")) == ([1], 2)
+
+    with pytest.raises(TypeError):
+        asyncio.run(my_function([1, "2"]))
+
+
+def test_coroutine_class_hints():
+
+    class MyClass:
+        pass
+
+    @typecast
+    async def my_cast_function(a: MyClass, b: int):
+        return (a, b)
+
+    value = MyClass()
+    assert asyncio.run(my_cast_function(value, "1")) == (value, 1)
+
+
+def test_coroutine_forward_hints():
+    node = Forward("Node")
+    node.define(Schema[{"value": Integer, "children": List[node]}])
+
+    @typecheck
+    def my_function(a: node):
+        return a
+
+    @typecheck
+    async def my_async_function(a: node):
+        return a
+
+    # Deep and cyclic values are accepted by both, invalid values are rejected by both
+    tree = {"value": 0, "children": []}
+    for index in range(2000):
+        tree = {"value": index, "children": [tree]}
+
+    cycle = {"value": 0, "children": []}
+    cycle["children"].append({"value": 1, "children": [cycle]})
+
+    for value in (tree, cycle):
+        assert my_function(value) is value
+        assert asyncio.run(my_async_function(value)) is value
+
+    cycle["children"].append({"value": "2", "children": []})
+
+    with pytest.raises(TypeError):
+        my_function(cycle)
+
+    with pytest.raises(TypeError):
+        asyncio.run(my_async_function(cycle))
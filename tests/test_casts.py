@@ -58,3 +58,113 @@ def test_hexadecimal_cast():
     assert Hexadecimal("badc0ffeZ") == "badc0ffe"
     assert isinstance("badc0ffe", Hexadecimal)
     assert not isinstance("badc0ffeZ", Hexadecimal)
+
+
+def test_copy_free_cast():
+    items = [1, 2, 3]
+    assert List[int](items) is items
+    assert List[int].cast(items, copy=True) is not items
+    assert List[int].cast(items, copy=True) == items
+
+    mapping = {"a": 1, "b": 2}
+    assert Dict[str, int](mapping) is mapping
+    assert Dict[str, int].cast(mapping, copy=True) is not mapping
+
+    pair = (1, "2")
+    assert Tuple[int, str](pair) is pair
+    assert Tuple[int, ...]((1, 2)) == (1, 2)
+
+    record = {"hello": 1, "sub": {"thing": 1}}
+    assert Schema[{"hello": int, "sub": {"thing": int}}](record) is record
+
+
+def test_copy_cast():
+
+    class Leaf(object):
+
+        def __deepcopy__(self, memo):
+            raise RuntimeError("Leaf cannot be copied")
+
+    leaf = Leaf()
+    nested = [[leaf], [leaf]]
+    output = List[List[Any]].cast(nested, copy=True)
+    assert output == nested
+    assert output is not nested
+    assert output[0] is not nested[0]
+    assert output[0][0] is leaf
+
+    record = {"hello": 1, "sub": {"thing": 1}}
+    output = Schema[{"hello": int, "sub": {"thing": int}}].cast(record, copy=True)
+    assert output == record
+    assert output["sub"] is not record["sub"]
+
+    # Copying only applies to the requested cast
+    assert List[int]([1]) is not List[int].cast([1], copy=True)
+    items = [1]
+    assert List[int](items) is items
+
+
+def test_lazy_copy_cast():
+    items = [1, 2, "3", 4]
+    output = List[int](items)
+    assert output == [1, 2, 3, 4]
+    assert items == [1, 2, "3", 4]
+
+    nested = [[1], ["2"]]
+    output = List[List[int]](nested)
+    assert output == [[1], [2]]
+    assert output[0] is nested[0]
+
+    assert List[int]((1, 2)) == [1, 2]
+    assert Tuple[int, int]([1, 2]) == (1, 2)
+    assert Dict[str, int]({"a": 1, "b": "2"}) == {"a": 1, "b": 2}
+
+    record = {"hello": 1, "sub": {"thing": "1"}}
+    output = Schema[{"hello": int, "sub": {"thing": int}}](record)
+    assert output == {"hello": 1, "sub": {"thing": 1}}
+    assert record["sub"] == {"thing": "1"}
+
+    # Extra and missing keys always produce a new dictionary
+    assert Schema[{"hello": int}]({"hello": 1, "extra": 2}) == {"hello": 1}
+    assert Schema[{"hello": Optional[int], "world": Optional[int]}]({"hello": 1, "extra": 2}) == {"hello": 1, "world": None}
+
+
+def test_record_cast():
+    record = Record[{"hello": int, "sub": {"thing": int}}]
+    output = record({"hello": "1", "sub": {"thing": True}, "extra": 2})
+    assert output.hello == 1
+    assert output.sub.thing == 1
+    assert output == (1, (1,))
+    assert not hasattr(output, "__dict__")
+    assert isinstance(output, record)
+    assert record(output) == output
+    assert not isinstance({"hello": 1, "sub": {"thing": 1}}, record)
+    assert not isinstance(record({"hello": 1, "sub": {"thing": "1"}}), Record[{"hello": int, "sub": {"thing": str}}])
+
+    with pytest.raises(TypeError):
+        record({"hello": "1", "sub": None})
+
+
+def test_record_field_names():
+    record = Record[{"first-name": str, "class": int, "_id": int}]
+    output = record({"first-name": "a", "class": "1", "_id": 2})
+    assert output == ("a", 1, 2)
+    assert record(output) == output
+    assert repr(record) == "Record[{'first-name': <class 'str'>, 'class': <class 'int'>, '_id': <class 'int'>}]"
+
+    with pytest.raises(TypeError):
+        Record[[("a", int)]]
+
+
+def test_record_pickle():
+    import pickle
+
+    record = Record[{"hello": int, "sub": {"thing": int}}]
+    output = record({"hello": 1, "sub": {"thing": 2}})
+
+    # Unpickled records are equal, and belong to a new record type which is pickled with them
+    value, value_type = pickle.loads(pickle.dumps((output, record)))
+    assert value == output
+    assert value.sub.thing == 2
+    assert isinstance(value, value_type)
+    assert not isinstance(value, record)
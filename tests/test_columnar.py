@@ -0,0 +1,96 @@
+import pytest
+
+from runtypes import *
+
+pandas = pytest.importorskip("pandas")
+pyarrow = pytest.importorskip("pyarrow")
+
+SCHEMA = Schema[{
+    "id": Integer,
+    "score": Float,
+    "active": Boolean,
+    "name": Text,
+    "code": Hexadecimal,
+    "email": Pattern[r"[a-z]+@[a-z]+\.com"],
+    "kind": Literal["a", "b"],
+    "note": Optional[Text],
+    "tags": List[Text],
+}]
+
+ROWS = [
+    {
+        "id": 1,
+        "score": 1.5,
+        "active": True,
+        "name": "a",
+        "code": "beef",
+        "email": "a@b.com",
+        "kind": "a",
+        "note": None,
+        "tags": ["a"]
+    },
+    {
+        "id": 2,
+        "score": 2.5,
+        "active": False,
+        "name": "b",
+        "code": "fish",
+        "email": "a@b.com",
+        "kind": "b",
+        "note": "note",
+        "tags": []
+    },
+    {
+        "id": 3,
+        "score": 3.5,
+        "active": True,
+        "name": "c",
+        "code": "f00d",
+        "email": "invalid",
+        "kind": "c",
+        "note": None,
+        "tags": [1]
+    },
+]
+
+
+def _expected():
+    return [isinstance(row, SCHEMA) for row in ROWS]
+
+
+def test_pandas_columns():
+    mask, failures = check_columns(pandas.DataFrame(ROWS), SCHEMA)
+    assert list(mask) == _expected()
+    assert failures == {"id": 0, "score": 0, "active": 0, "name": 0, "code": 1, "email": 1, "kind": 1, "note": 0, "tags": 1}
+
+
+def test_arrow_columns():
+    mask, failures = check_columns(pyarrow.Table.from_pylist(ROWS[:2]), List[SCHEMA])
+    assert list(mask) == [True, False]
+    assert failures["code"] == 1
+
+
+def test_column_types():
+    frame = pandas.DataFrame({"id": [1.0, 2.0], "name": [1, "b"]})
+    mask, failures = check_columns(frame, {"id": Integer, "name": Text, "missing": Optional[Integer]})
+    assert list(mask) == [False, False]
+    assert failures == {"id": 2, "name": 1, "missing": 0}
+
+    table = pyarrow.table({"id": [1, None], "flag": [True, False]})
+    mask, failures = check_columns(table, {"id": Integer, "flag": int})
+    assert list(mask) == [True, False]
+    assert failures == {"id": 1, "flag": 0}
+
+    # Missing sub-schema columns are validated as None
+    mask, failures = check_columns(table, {"id": Integer, "sub": {"a": Integer}})
+    assert list(mask) == [False, False]
+    assert failures == {"id": 1, "sub": 2}
+
+    # Patterns that RE2 does not support are matched one by one
+    table = pyarrow.table({"name": ["ab", "aa", None]})
+    mask, failures = check_columns(table, {"name": Pattern[r"(?!b)(\w)\1"]})
+    assert list(mask) == [False, True, False]
+    assert list(check_columns(table.to_pandas(), {"name": Pattern[r"(?!b)(\w)\1"]})[0]) == [False, True, False]
+
+    with pytest.raises(TypeError):
+        check_columns(ROWS, SCHEMA)
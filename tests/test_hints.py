@@ -36,6 +36,22 @@ def test_default_values():
         my_function(1, "2", 3, "4")
 
 
+def test_none_default_values():
+
+    @typecheck
+    def my_function(a: List[Integer] = None):
+        return a
+
+    assert my_function([1]) == [1]
+
+    # None defaults do not make the annotation optional, on any Python version
+    with pytest.raises(TypeError):
+        my_function(None)
+
+    with pytest.raises(TypeError):
+        my_function()
+
+
 def test_bad_default_values():
 
     @typecheck
@@ -78,3 +94,224 @@ def test_cast():
 
     with pytest.raises(TypeError):
         my_function(1, 2, 3, 4, 5)
+
+
+def test_typing_hints():
+    import typing
+
+    @typecheck
+    def my_function(a: typing.List[int], b: typing.Optional[str], c: typing.Dict[str, typing.Tuple[int, ...]], d: typing.Union[int, str, None] = None):
+        return (a, b, c, d)
+
+    assert my_function([1, 2], None, {"a": (1, 2, 3)}) == ([1, 2], None, {"a": (1, 2, 3)}, None)
+    assert my_function([], "b", {}, "d") == ([], "b", {}, "d")
+
+    with pytest.raises(TypeError):
+        my_function([1, "2"], None, {})
+
+    with pytest.raises(TypeError):
+        my_function([1, 2], 1, {})
+
+    with pytest.raises(TypeError):
+        my_function([1, 2], None, {"a": (1, "2")})
+
+    with pytest.raises(TypeError):
+        my_function([1, 2], None, {}, 1.0)
+
+
+def test_typing_literal_hints():
+    import typing
+
+    @typecheck
+    def my_function(a: typing.Literal["a", "b"], b: typing.Any):
+        return (a, b)
+
+    assert my_function("a", object)
+
+    with pytest.raises(TypeError):
+        my_function("c", None)
+
+
+def test_typing_cast_hints():
+    import typing
+
+    @typecast
+    def my_function(a: typing.List[int], b: typing.Optional[int]):
+        return (a, b)
+
+    assert my_function(["1", 2], "3") == ([1, 2], 3)
+    assert my_function([], None) == ([], None)
+
+
+def test_class_hints():
+
+    @typecheck
+    class MyClass:
+
+        def method(self, a: int):
+            return a
+
+        @staticmethod
+        def static_method(a: int):
+            return a
+
+        @classmethod
+        def class_method(cls, a: int):
+            return a
+
+        def _private_method(self, a: int):
+            return a
+
+    x = MyClass()
+
+    assert x.method(1) == 1
+    assert MyClass.static_method(1) == 1
+    assert MyClass.class_method(1) == 1
+    assert x._private_method("1") == "1"
+
+    for method in [x.method, MyClass.static_method, MyClass.class_method]:
+        with pytest.raises(TypeError):
+            method("1")
+
+
+def test_class_initializer_hints():
+
+    @typecheck
+    class MyCheckedClass:
+
+        def __init__(self, a: int):
+            self.a = a
+
+    @typecast
+    class MyCastedClass:
+
+        def __init__(self, a: int):
+            self.a = a
+
+    assert MyCheckedClass(1).a == 1
+    assert MyCastedClass("1").a == 1
+
+    with pytest.raises(TypeError):
+        MyCheckedClass("1")
+
+
+def test_class_variadic_hints():
+
+    @typecast
+    class MyClass:
+
+        def __init__(self, a: int, *args, **kwargs):
+            self.values = (a, args, kwargs)
+
+    assert MyClass("1", 2, 3, x=4).values == (1, (2, 3), {"x": 4})
+    assert MyClass(a="1").values == (1, (), {})
+
+
+def test_dataclass_hints():
+    import typing
+    import dataclasses
+
+    @typecheck
+    @dataclasses.dataclass
+    class MyDataClass:
+        a: int
+        b: typing.List[str] = dataclasses.field(default_factory=list)
+
+    assert MyDataClass(1).b == []
+    assert MyDataClass(1, ["b"]).b == ["b"]
+
+    with pytest.raises(TypeError):
+        MyDataClass("1")
+
+    with pytest.raises(TypeError):
+        MyDataClass(1, [1])
+
+    # Assignments are not checked by default
+    x = MyDataClass(1)
+    x.a = "1"
+
+
+def test_dataclass_assignment_hints():
+    import dataclasses
+
+    @typecheck(assignment=True)
+    @dataclasses.dataclass
+    class MyDataClass:
+        a: int
+
+    x = MyDataClass(1)
+    x.a = 2
+    x.other = "other"
+
+    with pytest.raises(TypeError):
+        x.a = "1"
+
+    @typecast(assignment=True)
+    @dataclasses.dataclass
+    class MyCastDataClass:
+        a: int
+
+    x = MyCastDataClass("1")
+    assert x.a == 1
+    x.a = "2"
+    assert x.a == 2
+
+    # Fields are validated once, when they are assigned by the initializer
+    calls = []
+
+    @typechecker
+    def Counted(value):
+        calls.append(value)
+        return int(value)
+
+    @typecast(assignment=True)
+    @dataclasses.dataclass
+    class MyCountedDataClass:
+        a: Counted
+
+    assert MyCountedDataClass("1").a == 1
+    assert calls == ["1"]
+
+
+def test_frozen_dataclass_cast():
+    import dataclasses
+
+    @typecast
+    @dataclasses.dataclass(frozen=True)
+    class MyDataClass:
+        a: int
+        b: Optional[Boolean] = None
+
+        def method(self, c: int):
+            return self.a + c
+
+    x = MyDataClass("1", 1)
+    assert (x.a, x.b) == (1, True)
+    assert x.method("2") == 3
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        x.a = 2
+
+
+def test_partial_and_callable_hints():
+    import functools
+
+    def my_function(a: int, b: str):
+        return (a, b)
+
+    class MyCallable:
+
+        def __call__(self, a: int):
+            return a
+
+    partial_function = typecheck(functools.partial(my_function, 1))
+    assert partial_function("2") == (1, "2")
+
+    with pytest.raises(TypeError):
+        partial_function(2)
+
+    callable_object = typecheck(MyCallable())
+    assert callable_object(1) == 1
+
+    with pytest.raises(TypeError):
+        callable_object("1")
@@ -0,0 +1,151 @@
+import pytest
+
+from runtypes import *
+
+
+def test_forward():
+    node = Forward("Node")
+    node.define(Schema[{"value": Integer, "children": List[node]}])
+
+    tree = {"value": 1, "children": [{"value": 2, "children": []}]}
+    assert isinstance(tree, node)
+    assert not isinstance({"value": 1, "children": [{"value": "2", "children": []}]}, node)
+    assert node({"value": "1", "children": []}) == {"value": 1, "children": []}
+    assert repr(node) == "Node"
+
+    with pytest.raises(TypeError):
+        node.define(Integer)
+
+    with pytest.raises(NotImplementedError):
+        node[Integer]
+
+    with pytest.raises(ArgumentError):
+        isinstance(1, Forward("Undefined"))
+
+
+def test_check_iterative():
+    check_iterative({"a": [1, 2], "b": (1, "2"), "c": None}, Schema[{"a": List[Integer], "b": Tuple[Integer, Text], "c": Optional[Integer]}])
+    check_iterative({"a": {"b": [1, "2"]}}, Dict[Text, Dict[Text, List[Union[Integer, Text]]]])
+    record = Record[{"a": int, "sub": {"b": str}}]
+    check_iterative(record({"a": 1, "sub": {"b": "b"}}), record)
+    check_iterative((1, 2, 3), Tuple[Integer, ...])
+
+    with pytest.raises(TypeError):
+        check_iterative({"a": [1, "2"]}, Schema[{"a": List[Integer]}])
+
+    with pytest.raises(TypeError):
+        check_iterative({"a": {"b": [1, 2.0]}}, Dict[Text, Dict[Text, List[Union[Integer, Text]]]])
+
+    with pytest.raises(TypeError):
+        check_iterative((1, 2), Tuple[Integer])
+
+
+def test_deep_values():
+    node = Forward("Node")
+    node.define(Schema[{"value": Integer, "children": List[node]}])
+
+    # Create a tree which is too deep for recursive validation
+    tree = {"value": 0, "children": []}
+    for index in range(10000):
+        tree = {"value": index, "children": [tree]}
+
+    check_iterative(tree, node, max_depth=100000)
+
+    with pytest.raises(TypeError):
+        check_iterative(tree, node, max_depth=100)
+
+
+def test_cyclic_values():
+    node = Forward("Node")
+    node.define(Schema[{"value": Integer, "children": List[node]}])
+
+    # Create a cyclic graph
+    tree = {"value": 0, "children": []}
+    tree["children"].append({"value": 1, "children": [tree]})
+
+    check_iterative(tree, node)
+
+    tree["children"].append({"value": "2", "children": []})
+
+    with pytest.raises(TypeError):
+        check_iterative(tree, node)
+
+
+def test_union_values():
+    node = Forward("Node")
+    node.define(Schema[{"value": Integer, "next": Union[node, Literal[None]]}])
+
+    # Create a deep chain through a union
+    chain = {"value": 0, "next": None}
+    for index in range(5000):
+        chain = {"value": index, "next": chain}
+
+    check_iterative(chain, node, max_depth=100000)
+
+    with pytest.raises(TypeError):
+        check_iterative(chain, node, max_depth=100)
+
+    # Create a cyclic graph through a union
+    graph = Forward("Graph")
+    graph.define(Schema[{"value": Integer, "children": List[Union[graph, Integer]]}])
+
+    tree = {"value": 0, "children": [1]}
+    tree["children"].append({"value": 1, "children": [tree, 2]})
+
+    check_iterative(tree, graph)
+
+    tree["children"].append({"value": "2", "children": []})
+
+    with pytest.raises(TypeError):
+        check_iterative(tree, graph)
+
+    # Failed members are backtracked to the next member
+    check_iterative([[1, "a"]], List[Union[List[Integer], List[Text], List[Union[Integer, Text]]]])
+
+
+def test_record_values():
+    node = Forward("Node")
+    record = Record[{"value": Integer, "next": Optional[node]}]
+    node.define(record)
+
+    # Create a deep chain of records, without casting every level again
+    record_class = type(record({"value": 0, "next": None}))
+    chain = None
+    for index in range(5000):
+        chain = record_class(index, chain)
+
+    check_iterative(chain, node, max_depth=100000)
+
+    with pytest.raises(TypeError):
+        check_iterative(record_class(0, record_class("1", None)), node)
+
+
+def test_forward_values():
+    node = Forward("Node")
+    node.define(Schema[{"value": Integer, "children": List[node]}])
+
+    # Deep values are checked without recursion by isinstance too
+    tree = {"value": 0, "children": []}
+    for index in range(2000):
+        tree = {"value": index, "children": [tree]}
+
+    assert isinstance(tree, node)
+    check_iterative(tree, node, max_depth=100000)
+
+    # Deep values can't be cast recursively, which fails with a clear error
+    with pytest.raises(TypeError, match="too deep"):
+        node(tree)
+
+    # Cyclic values are accepted by both
+    cycle = {"value": 0, "children": []}
+    cycle["children"].append({"value": 1, "children": [cycle]})
+
+    assert isinstance(cycle, node)
+    check_iterative(cycle, node)
+
+    # Invalid values are rejected by both
+    cycle["children"].append({"value": "2", "children": []})
+
+    assert not isinstance(cycle, node)
+    with pytest.raises(TypeError):
+        check_iterative(cycle, node)
@@ -0,0 +1,56 @@
+import json
+import pytest
+
+from runtypes import *
+
+
+def test_check_loads():
+    schema = Schema[{"name": Text, "tags": List[Text], "sub": {"value": Optional[Integer]}}]
+    document = '{"name": "a", "tags": ["b", "c"], "sub": {"value": 1}, "extra": [1, {"2": 3}]}'
+    assert check_loads(document, schema) == json.loads(document)
+    assert check_loads(document.encode(), schema) == json.loads(document)
+    assert check_loads('{"name": "a", "tags": [], "sub": {}}', schema) == {"name": "a", "tags": [], "sub": {}}
+
+    with pytest.raises(TypeError):
+        check_loads('{"name": 1, "tags": [], "sub": {}}', schema)
+
+    with pytest.raises(TypeError):
+        check_loads('{"name": "a", "tags": [1], "sub": {}}', schema)
+
+    with pytest.raises(TypeError):
+        check_loads('{"name": "a", "tags": [], "sub": []}', schema)
+
+    with pytest.raises(TypeError):
+        check_loads('{"name": "a", "tags": []}', schema)
+
+
+def test_check_loads_fails_early():
+    # The syntax error after the invalid field is never reached
+    with pytest.raises(TypeError):
+        check_loads('[1, 2, "3", ', List[Integer])
+
+
+def test_check_loads_containers():
+    assert check_loads(' [ ] ', List[Integer]) == []
+    assert check_loads('{"a": [1, 2]}', Dict[Text, List[Integer]]) == {"a": [1, 2]}
+    assert check_loads('null', Optional[List[Integer]]) is None
+    assert check_loads('1.5', Float) == 1.5
+
+    with pytest.raises(TypeError):
+        check_loads('{"a": [1, "2"]}', Dict[Text, List[Integer]])
+
+
+def test_cast_loads():
+    schema = Schema[{"id": int, "sub": {"flag": Boolean}}]
+    assert cast_loads('{"id": "1", "sub": {"flag": 1}, "extra": 2}', schema) == {"id": 1, "sub": {"flag": True}}
+    assert cast_loads('["1", 2]', List[Integer]) == [1, 2]
+    assert cast_loads('{"a": "1"}', Dict[Text, int]) == {"a": 1}
+
+
+def test_syntax_errors():
+    for document in ['{"a": 1', '[1 2]', '{"a" 1}', '{a: 1}', '[1] 2', '']:
+        with pytest.raises(json.JSONDecodeError):
+            check_loads(document, Any)
+
+    with pytest.raises(json.JSONDecodeError):
+        check_loads('[1, 2', List[Integer])
@@ -0,0 +1,84 @@
+import typing
+import pytest
+import threading
+
+from runtypes import *
+from runtypes.hints import _translate_type_hint
+
+
+def _hammer(function, threads=16, iterations=200):
+    # Start all threads at once to maximize contention
+    barrier = threading.Barrier(threads)
+    errors = []
+
+    def run():
+        barrier.wait()
+        try:
+            for index in range(iterations):
+                function(index)
+        except BaseException as error:
+            errors.append(error)
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert not errors
+
+
+def test_check_many():
+    check_many(list(range(1000)), Integer, threads=4)
+    check_many((value for value in range(10)), Integer)
+    check_many([], Integer)
+
+    with pytest.raises(TypeError):
+        check_many([1], Integer, threads=0)
+
+    with pytest.raises(TypeError, match="index 500"):
+        check_many(list(range(500)) + ["500"] + list(range(500)), Integer, threads=4)
+
+    # The lowest failing index is reported, even if a later chunk fails first
+    for _ in range(20):
+        with pytest.raises(TypeError, match="index 3 "):
+            check_many(list(range(3)) + ["3"] * 1000, Integer, threads=8)
+
+
+def test_cast_many():
+    assert cast_many([str(value) for value in range(1000)], Integer, threads=4) == list(range(1000))
+    assert cast_many([], Integer) == []
+
+    with pytest.raises(ValueError):
+        cast_many(["1", "a"], Integer, threads=2)
+
+
+def test_cached_stress():
+    cached_email = Email.cached(maxsize=64)
+
+    def function(index):
+        assert isinstance(f"user{index % 100}@example.com", cached_email)
+        assert not isinstance(f"user{index % 100}", cached_email)
+
+    _hammer(function)
+
+    info = cached_email.cache_info()
+    assert info.currsize <= 64
+    assert info.hits + info.misses == 16 * 200 * 2
+
+
+def test_shared_state_stress():
+    schema = {"a": int, "sub": {"b": str}}
+    record = Record[schema]
+    records = []
+
+    def function(index):
+        records.append(record({"a": index, "sub": {"b": "b"}}))
+        assert _translate_type_hint(typing.List[typing.Optional[int]]) is _translate_type_hint(typing.List[typing.Optional[int]])
+        check_many([{"a": index, "sub": {"b": "b"}}] * 8, Schema[schema], threads=2)
+
+    _hammer(function, iterations=20)
+
+    # Concurrent casts must not mix up the values of different records
+    assert sorted(value.a for value in records) == sorted(list(range(20)) * 16)
+    assert all(value.sub.b == "b" for value in records)
@@ -1,3 +1,5 @@
+import pytest
+
 from runtypes import *
 
 
@@ -10,3 +12,85 @@ def test_optional_parameters():
 
     assert isinstance("Test", my_type)
     assert not isinstance("Test", my_type["Test"])
+
+
+def test_cached():
+    cached_email = Email.cached(maxsize=2)
+
+    assert isinstance("user@example.com", cached_email)
+    assert isinstance("user@example.com", cached_email)
+    assert not isinstance("user", cached_email)
+    assert not isinstance("user", cached_email)
+    assert cached_email.cache_info() == CacheInfo(hits=2, misses=2, evictions=0, maxsize=2, currsize=2)
+
+    # Least recently used results are evicted
+    assert isinstance("other@example.com", cached_email)
+    assert cached_email.cache_info().evictions == 1
+
+    # Unhashable values bypass the cache
+    assert not isinstance(["user@example.com"], cached_email)
+    assert cached_email.cache_info().currsize == 2
+
+    cached_email.cache_clear()
+    assert cached_email.cache_info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=2, currsize=0)
+
+
+def test_cached_types():
+    cached_integer = Integer.cached()
+
+    # Equal values of different types are cached separately
+    assert isinstance(1, cached_integer)
+    assert not isinstance(True, cached_integer)
+    assert not isinstance(1.0, cached_integer)
+    assert cached_integer("1") == 1
+
+    # Containers are never cached, since equal containers may hold items of different types
+    cached_tuple = Tuple[Integer].cached()
+    assert isinstance((1,), cached_tuple)
+    assert not isinstance((True,), cached_tuple)
+    assert cached_tuple.cache_info().currsize == 0
+
+    with pytest.raises(NotImplementedError):
+        Pattern.cached()["[a-z]+"]
+
+
+def test_registered():
+    registered_tuple = Tuple[Integer, ...].registered(maxsize=2)
+
+    value = tuple(range(100))
+    assert isinstance(value, registered_tuple)
+    assert isinstance(value, registered_tuple)
+    assert registered_tuple.cache_info() == CacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1)
+
+    # Equal but distinct objects are validated again
+    assert isinstance(tuple(range(100)), registered_tuple)
+    assert registered_tuple.cache_info().hits == 1
+
+    # Failures are never registered
+    assert not isinstance((1, "2"), registered_tuple)
+    assert registered_tuple.cache_info() == CacheInfo(hits=1, misses=3, evictions=0, maxsize=2, currsize=2)
+
+    # Mutable objects are never registered
+    registered_list = List[Integer].registered()
+    value = [1, 2]
+    assert isinstance(value, registered_list)
+    value.append("3")
+    assert not isinstance(value, registered_list)
+    assert registered_list.cache_info() == CacheInfo(hits=0, misses=2, evictions=0, maxsize=1024, currsize=0)
+
+    # Tuples containing mutable objects are never registered
+    registered_nested = Tuple[List[Integer]].registered()
+    value = ([1],)
+    assert isinstance(value, registered_nested)
+    value[0].append("2")
+    assert not isinstance(value, registered_nested)
+
+
+def test_registered_records():
+    record = Record[{"a": int, "sub": {"b": str}}]
+    registered_record = record.registered()
+
+    value = record({"a": 1, "sub": {"b": "b"}})
+    assert isinstance(value, registered_record)
+    assert isinstance(value, registered_record)
+    assert registered_record.cache_info().hits == 1
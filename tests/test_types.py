@@ -45,6 +45,45 @@ def test_bytes():
     assert not isinstance(0, ByteString)
 
 
+def test_bytes_buffers():
+    import mmap
+
+    buffer = bytearray(b"Hello")
+    assert ByteString(buffer) is buffer
+    assert ByteString([72, 105]) == b"Hi"
+    assert isinstance(memoryview(b"Hello"), ByteString)
+    assert isinstance(memoryview(b"Hello"), ByteString[5])
+    assert not isinstance(b"Hello", ByteString[4])
+    assert not isinstance("Hello", ByteString)
+
+    with pytest.raises(TypeError):
+        ByteString[4](b"Hello")
+
+    mapped = mmap.mmap(-1, 4)
+    mapped.write(b"beef")
+    assert ByteString[4](mapped) is mapped
+    assert isinstance(mapped, HexadecimalBytes)
+    mapped.close()
+
+
+def test_byte_charsets():
+    assert HexadecimalBytes(b"badc0ffeZ") == b"badc0ffe"
+    assert isinstance(b"badc0ffe", HexadecimalBytes)
+    assert isinstance(memoryview(bytearray(b"badc0ffe")), HexadecimalBytes)
+    assert isinstance(memoryview(b"ab").cast("H"), HexadecimalBytes)
+    assert not isinstance(memoryview(b"abcdef")[::2], HexadecimalBytes)
+    assert not isinstance(b"badc0ffeZ", HexadecimalBytes)
+    assert not isinstance("badc0ffe", HexadecimalBytes)
+    assert isinstance(b"SGVsbG8gV29ybGQ=", Base64Bytes)
+    assert not isinstance(b"SGVsbG8gV29ybGQ=\x00", Base64Bytes)
+    assert isinstance(b"Hello World!\n", PrintableBytes)
+    assert not isinstance(b"\xff", PrintableBytes)
+    assert isinstance(bytes(range(256)), ByteCharset[bytes(range(256))])
+
+    with pytest.raises(TypeError):
+        HexadecimalBytes(memoryview(b"abcdeZ")[::2])
+
+
 def test_list():
     assert List[Union[Text, Integer]](["1", 2]) == ["1", 2]
     with pytest.raises(ArgumentError):
@@ -68,6 +107,13 @@ def test_tuple():
     assert not isinstance("Hello World", Tuple[Integer, Integer, Integer])
 
 
+def test_variadic_tuple():
+    assert Tuple[Integer, ...](()) == ()
+    assert Tuple[int, ...](("1", 2)) == (1, 2)
+    assert isinstance((1, 2, 3), Tuple[Integer, ...])
+    assert not isinstance((1, 2, "3"), Tuple[Integer, ...])
+
+
 def test_integer():
     assert Integer(1) == 1
     assert isinstance(1, Integer)